@@ -5,7 +5,7 @@ from tkinter import ttk
 import math
 import random
 
-from PIL import Image, ImageDraw, ImageTk
+from PIL import Image, ImageTk
 
 from config import DARK_THEME
 from constants import FLAP_CHARS
@@ -39,20 +39,26 @@ def anim_tick(app):
     if app._ticker_running:
         ticker.ticker_step(app)
 
+    # Transient effects only run while listed in app._active_anims
+    active = app._active_anims
+
     # Glitch effect (overrides pulse)
-    animate_glitch(app)
+    if "glitch" in active:
+        animate_glitch(app)
 
     # Pulsing borders (skipped during glitch/flash)
     pulse_borders(app)
 
     # Sash flash
-    animate_sash_flash(app)
+    if "sash_flash" in active:
+        animate_sash_flash(app)
 
     # Header glitch
     animate_header_glitch(app)
 
     # Feed glows
-    animate_feed_glows(app)
+    if "feed_glow" in active:
+        animate_feed_glows(app)
 
     # Title glow
     animate_title_glow(app)
@@ -71,7 +77,8 @@ def anim_tick(app):
     animate_status_bar(app)
 
     # Typewriter effect
-    animate_typewriter(app)
+    if "typewriter" in active:
+        animate_typewriter(app)
 
     # Matrix rain (every frame for smooth motion)
     animate_rain(app)
@@ -86,14 +93,56 @@ def anim_tick(app):
     app._anim_id = app.root.after(33, lambda: anim_tick(app))
 
 
+# -- Sine tables -----------------------------------------------------------
+
+# (sin + 1) / 2 over one period, keyed by period in frames
+_sine_tables = {}
+
+
+def sine_wave(frame, period):
+    """Return (sin(2*pi*frame/period) + 1) / 2 from a per-period lookup table."""
+    table = _sine_tables.get(period)
+    if table is None:
+        table = [(math.sin(f * (2 * math.pi / period)) + 1) / 2 for f in range(period)]
+        _sine_tables[period] = table
+    return table[frame % period]
+
+
+# -- Color blending --------------------------------------------------------
+
+# Parsed "#rrggbb" -> (r, g, b), and blended colors keyed by (hex1, hex2, step)
+_rgb_cache = {}
+_lerp_cache = {}
+_LERP_CACHE_MAX = 4096
+# Two-digit lowercase hex for each channel value, for hot loops that blend inline
+_HEX_BYTE = tuple(f"{i:02x}" for i in range(256))
+
+
+def hex_to_rgb(hex_color):
+    """Parse a #rrggbb color into an (r, g, b) tuple, cached."""
+    rgb = _rgb_cache.get(hex_color)
+    if rgb is None:
+        rgb = (int(hex_color[1:3], 16), int(hex_color[3:5], 16), int(hex_color[5:7], 16))
+        _rgb_cache[hex_color] = rgb
+    return rgb
+
+
 def lerp_color(hex1, hex2, t):
-    """Linearly interpolate between two hex colors."""
-    r1, g1, b1 = int(hex1[1:3], 16), int(hex1[3:5], 16), int(hex1[5:7], 16)
-    r2, g2, b2 = int(hex2[1:3], 16), int(hex2[3:5], 16), int(hex2[5:7], 16)
-    r = int(r1 + (r2 - r1) * t)
-    g = int(g1 + (g2 - g1) * t)
-    b = int(b1 + (b2 - b1) * t)
-    return f"#{r:02x}{g:02x}{b:02x}"
+    """Linearly interpolate between two hex colors (t quantized to 1/255)."""
+    step = int(t * 255 + 0.5)
+    key = (hex1, hex2, step)
+    color = _lerp_cache.get(key)
+    if color is None:
+        r1, g1, b1 = hex_to_rgb(hex1)
+        r2, g2, b2 = hex_to_rgb(hex2)
+        r = r1 + (r2 - r1) * step // 255
+        g = g1 + (g2 - g1) * step // 255
+        b = b1 + (b2 - b1) * step // 255
+        color = f"#{r:02x}{g:02x}{b:02x}"
+        if len(_lerp_cache) >= _LERP_CACHE_MAX:
+            _lerp_cache.clear()
+        _lerp_cache[key] = color
+    return color
 
 
 def create_gradient_image(app, width, height, color1, color2, cache_key=None):
@@ -105,39 +154,42 @@ def create_gradient_image(app, width, height, color1, color2, cache_key=None):
         return None
     r1, g1, b1 = int(color1[1:3], 16), int(color1[3:5], 16), int(color1[5:7], 16)
     r2, g2, b2 = int(color2[1:3], 16), int(color2[3:5], 16), int(color2[5:7], 16)
-    img = Image.new("RGB", (width, height))
-    draw = ImageDraw.Draw(img)
-    # Draw diagonal lines from top-right to bottom-left; each line shares the same
-    # diagonal distance factor (0..1) which maps to the color blend.
+    # Every pixel on an anti-diagonal (x + y == d) shares the same blend factor,
+    # so build one RGB ramp indexed by d and slice each row out of it.
+    n = width + height - 1
     max_d = width + height - 2 if (width + height - 2) > 0 else 1
-    for d in range(width + height - 1):
+    ramp = bytearray(3 * n)
+    for d in range(n):
         t = d / max_d
-        r = int(r1 + (r2 - r1) * t)
-        g = int(g1 + (g2 - g1) * t)
-        b = int(b1 + (b2 - b1) * t)
-        color = f"#{r:02x}{g:02x}{b:02x}"
-        # Each anti-diagonal line: from (d,0) toward (0,d)
-        x0 = min(d, width - 1)
-        y0 = d - x0
-        x1 = max(d - (height - 1), 0)
-        y1 = d - x1
-        draw.line([(x0, y0), (x1, y1)], fill=color)
+        ramp[3 * d] = int(r1 + (r2 - r1) * t)
+        ramp[3 * d + 1] = int(g1 + (g2 - g1) * t)
+        ramp[3 * d + 2] = int(b1 + (b2 - b1) * t)
+    row_bytes = 3 * width
+    data = b"".join(ramp[3 * y:3 * y + row_bytes] for y in range(height))
+    img = Image.frombytes("RGB", (width, height), data)
     photo = ImageTk.PhotoImage(img)
     key = cache_key or id(photo)
     app._gradient_cache[key] = photo
     return photo
 
 
+def set_panel_border(app, widget, color):
+    """Set a panel's highlightbackground, skipping the Tcl call if unchanged."""
+    if app._panel_border_colors.get(widget) != color:
+        app._panel_border_colors[widget] = color
+        widget.configure(highlightbackground=color)
+
+
 def pulse_borders(app):
     """Animate panel borders with sine-wave pulsing at different intervals."""
     if app._glitch_active or app._sash_flash_active:
         return
     for widget, color_key, period in app._neon_panels:
-        t_val = (math.sin(app._anim_frame * (2 * math.pi / period)) + 1) / 2
+        t_val = sine_wave(app._anim_frame, period)
         bright = DARK_THEME[color_key]
         dim = DARK_THEME[color_key + "_dim"]
         color = lerp_color(dim, bright, t_val)
-        widget.configure(highlightbackground=color)
+        set_panel_border(app, widget, color)
 
 
 def animate_title_glow(app):
@@ -145,9 +197,11 @@ def animate_title_glow(app):
     if not hasattr(app, '_title_canvas') or app._title_canvas is None:
         return
     canvas = app._title_canvas
-    t_val = (math.sin(app._anim_frame * (2 * math.pi / 180)) + 1) / 2
+    t_val = sine_wave(app._anim_frame, 180)
     color = lerp_color(DARK_THEME["cyan"], DARK_THEME["magenta"], t_val)
-    canvas.itemconfigure(app._title_main, fill=color)
+    if color != app._title_glow_color:
+        app._title_glow_color = color
+        canvas.itemconfigure(app._title_main, fill=color)
     # Chromatic aberration flicker — brief burst at random intervals (5s-1m)
     cx = canvas.winfo_width() // 2
     cy = canvas.winfo_height() // 2
@@ -195,72 +249,92 @@ def draw_title_neon_line(app):
     perimeter = 2 * w + 2 * h
     max_diag = w + h if (w + h) > 0 else 1  # for diagonal factor normalization
 
-    # Initialize segments on resize -- store (rid, seg_pos, diag_factor)
+    # Initialize segments on resize -- store (canvas path, rid, seg_pos, wave_rgb)
     if not hasattr(app, '_border_seg_count') or app._border_seg_count != (w, h):
         app._border_seg_count = (w, h)
         for canvas in [top, bottom, left, right]:
             canvas.delete("all")
-        app._border_ids = {'top': [], 'bottom': [], 'left': [], 'right': []}
-
-        # Top: left to right -- y=0, x varies
-        for x in range(0, w, 4):
-            rid = top.create_rectangle(x, 0, x + 4, thickness, fill=t["bg"], outline="")
-            diag = x / max_diag  # top-left=0, top-right=~0.5
-            app._border_ids['top'].append((rid, x / perimeter, diag))
-
-        # Right: top to bottom -- x=w, y varies
-        for y in range(0, h, 4):
-            rid = right.create_rectangle(0, y, thickness, y + 4, fill=t["bg"], outline="")
-            diag = (w + y) / max_diag  # top-right=~0.5, bottom-right=1.0
-            app._border_ids['right'].append((rid, (w + y) / perimeter, min(diag, 1.0)))
-
-        # Bottom: right to left -- y=h, x varies (reversed)
-        for x in range(w, 0, -4):
-            rid = bottom.create_rectangle(x - 4, 0, x, thickness, fill=t["bg"], outline="")
-            diag = (x + h) / max_diag  # bottom-right=1.0, bottom-left=~0.5
-            app._border_ids['bottom'].append((rid, (w + h + (w - x)) / perimeter, min(diag, 1.0)))
-
-        # Left: bottom to top -- x=0, y varies (reversed)
-        for y in range(h, 0, -4):
-            rid = left.create_rectangle(0, y - 4, thickness, y, fill=t["bg"], outline="")
-            diag = y / max_diag  # bottom-left=~0.5, top-left=0
-            app._border_ids['left'].append((rid, (2 * w + h + (h - y)) / perimeter, diag))
+
+        # Precompute each side's (rect coords, perimeter pos, diagonal factor)
+        # up front so creation below is a single tight loop per canvas
+        segments = {
+            # Top: left to right -- y=0, x varies; top-left=0, top-right=~0.5
+            'top': [((x, 0, x + 4, thickness), x / perimeter, x / max_diag)
+                    for x in range(0, w, 4)],
+            # Right: top to bottom -- x=w, y varies; top-right=~0.5, bottom-right=1.0
+            'right': [((0, y, thickness, y + 4), (w + y) / perimeter,
+                       min((w + y) / max_diag, 1.0))
+                      for y in range(0, h, 4)],
+            # Bottom: right to left -- y=h, x varies; bottom-right=1.0, bottom-left=~0.5
+            'bottom': [((x - 4, 0, x, thickness), (w + h + (w - x)) / perimeter,
+                        min((x + h) / max_diag, 1.0))
+                       for x in range(w, 0, -4)],
+            # Left: bottom to top -- x=0, y varies; bottom-left=~0.5, top-left=0
+            'left': [((0, y - 4, thickness, y), (2 * w + h + (h - y)) / perimeter,
+                      y / max_diag)
+                     for y in range(h, 0, -4)],
+        }
+        # One flat list of segment records, clockwise from the top-left corner.
+        # Each wave's peak color varies by diagonal position, which is fixed
+        # for a given window size, so resolve it to RGB once here
+        app._border_segs = []
+        for side, canvas in (('top', top), ('right', right), ('bottom', bottom), ('left', left)):
+            create = canvas.create_rectangle
+            path = str(canvas)
+            app._border_segs.extend(
+                (path, create(*coords, fill=t["bg"], outline=""), seg_pos,
+                 hex_to_rgb(lerp_color(t["cyan"], t["magenta"], diag)))
+                for coords, seg_pos, diag in segments[side]
+            )
+        app._border_fills = [t["bg"]] * len(app._border_segs)
 
     # Update all segments with dual wave colors + diagonal gradient
     base_color = t["bg"]
-    cyan = t["cyan"]
-    magenta = t["magenta"]
-    for side in ['top', 'right', 'bottom', 'left']:
-        canvas = {'top': top, 'right': right, 'bottom': bottom, 'left': left}[side]
-        for rid, seg_pos, diag in app._border_ids[side]:
-            # Each wave's peak color varies by diagonal position
-            wave_color = lerp_color(cyan, magenta, diag)
-
-            # Distance to wave 1
-            dist1 = min(abs(seg_pos - pos1), 1.0 - abs(seg_pos - pos1))
-            bright1 = max(0, 1.0 - dist1 * 8)
-
-            # Distance to wave 2
-            dist2 = min(abs(seg_pos - pos2), 1.0 - abs(seg_pos - pos2))
-            bright2 = max(0, 1.0 - dist2 * 8)
-
-            # Blend: both waves use the same position-based color
-            total_bright = max(bright1, bright2)
-            if total_bright > 0:
-                color = lerp_color(base_color, wave_color, total_bright)
-            else:
-                color = base_color
+    # Collect every segment update into one Tcl script so the whole frame costs
+    # a single interpreter round-trip instead of one itemconfigure per segment
+    commands = []
+    fills = app._border_fills
+    hex_byte = _HEX_BYTE
+    base_r, base_g, base_b = hex_to_rgb(base_color)
+    for i, (path, rid, seg_pos, (wave_r, wave_g, wave_b)) in enumerate(app._border_segs):
+        # Distance to wave 1
+        dist1 = min(abs(seg_pos - pos1), 1.0 - abs(seg_pos - pos1))
+        bright1 = max(0, 1.0 - dist1 * 8)
+
+        # Distance to wave 2
+        dist2 = min(abs(seg_pos - pos2), 1.0 - abs(seg_pos - pos2))
+        bright2 = max(0, 1.0 - dist2 * 8)
+
+        # Blend: both waves use the same position-based color
+        total_bright = max(bright1, bright2)
+        if total_bright > 0:
+            # Same 1/255 integer blend as lerp_color, inlined: the (base, wave,
+            # step) combinations here would churn through lerp_color's cache
+            step = int(total_bright * 255 + 0.5)
+            color = ("#" + hex_byte[base_r + (wave_r - base_r) * step // 255]
+                     + hex_byte[base_g + (wave_g - base_g) * step // 255]
+                     + hex_byte[base_b + (wave_b - base_b) * step // 255])
+        else:
+            color = base_color
 
-            canvas.itemconfigure(rid, fill=color)
+        # Most segments sit far from both waves and keep the same color
+        if fills[i] != color:
+            fills[i] = color
+            commands.append(f"{path} itemconfigure {rid} -fill {color}")
+
+    if commands:
+        top.tk.eval("\n".join(commands))
 
 
 def animate_status_bar(app):
     """Blink the cursor, update clock, and cycle idle messages."""
     # Cursor blink
     visible = (app._anim_frame // 16) % 2 == 0
-    app._cursor_label.configure(
-        fg=DARK_THEME["cyan"] if visible else DARK_THEME["status_bg"]
-    )
+    if visible != app._cursor_visible:
+        app._cursor_visible = visible
+        app._cursor_label.configure(
+            fg=DARK_THEME["cyan"] if visible else DARK_THEME["status_bg"]
+        )
 
     # Check if we should resume idle cycling
     if not app._idle_active and app._anim_frame >= app._idle_pause_until:
@@ -281,15 +355,13 @@ def animate_status_bar(app):
         else:
             # Message complete, display for random interval then move to next
             app._idle_display_frames += 1
-            # Random intervals: 3s, 5s, 7s, 9s, 12s (at 30fps)
-            if not hasattr(app, '_idle_current_duration'):
-                app._idle_current_duration = random.choice([90, 150, 210, 270, 360])
-            if app._idle_display_frames > app._idle_current_duration:
-                # Move to next message with new random duration
+            # Durations were shuffled once at startup; cycle through them
+            if app._idle_display_frames > app._idle_durations[app._idle_duration_index]:
+                # Move to next message and the next duration in the cycle
                 app._idle_message_index = (app._idle_message_index + 1) % len(app._idle_messages)
+                app._idle_duration_index = (app._idle_duration_index + 1) % len(app._idle_durations)
                 app._idle_char_pos = 0
                 app._idle_display_frames = 0
-                app._idle_current_duration = random.choice([90, 150, 210, 270, 360])
 
 
 # -- Hover glow (Feature 3) -----------------------------------------------
@@ -336,6 +408,7 @@ def on_article_leave(app, event):
 def start_glitch(app):
     """Activate a pulse sweep effect on refresh start."""
     app._glitch_active = True
+    app._active_anims.add("glitch")
     app._glitch_start_frame = app._anim_frame
     app._glitch_duration = 30  # ~1s at 30fps
     # Trigger static noise burst alongside glitch
@@ -345,12 +418,14 @@ def start_glitch(app):
 def animate_glitch(app):
     """Two bright pulses that sweep across panels, then fade."""
     if not app._glitch_active:
+        app._active_anims.discard("glitch")
         return
     elapsed = app._anim_frame - app._glitch_start_frame
     if elapsed < 0:
         elapsed += 3600
     if elapsed >= app._glitch_duration:
         app._glitch_active = False
+        app._active_anims.discard("glitch")
         return
     t = elapsed / app._glitch_duration
     # Two pulses using a sine wave
@@ -366,7 +441,7 @@ def animate_glitch(app):
         dim = accent_colors.get(color_key, DARK_THEME["cyan_dim"])
         hot = hot_colors.get(color_key, "#aaffff")
         color = lerp_color(dim, hot, brightness)
-        widget.configure(highlightbackground=color)
+        set_panel_border(app, widget, color)
     # Pulse treeview backgrounds
     tree_bg = lerp_color(DARK_THEME["bg"], "#102838", brightness)
     style = ttk.Style()
@@ -404,6 +479,7 @@ def on_sash_release(app, event):
     """Trigger border flash on sash release."""
     if app._sash_dragging:
         app._sash_flash_active = True
+        app._active_anims.add("sash_flash")
         app._sash_flash_end_frame = (app._anim_frame + 10) % 3600
         app._sash_dragging = False
 
@@ -411,15 +487,17 @@ def on_sash_release(app, event):
 def animate_sash_flash(app):
     """Fade panel borders from white back to normal after sash release."""
     if not app._sash_flash_active:
+        app._active_anims.discard("sash_flash")
         return
     remaining = (app._sash_flash_end_frame - app._anim_frame) % 3600
     if remaining > 10 or remaining == 0:
         app._sash_flash_active = False
+        app._active_anims.discard("sash_flash")
         return
     t = remaining / 10.0
     flash_color = lerp_color(DARK_THEME["cyan"], "#ffffff", t)
     for widget, _, _ in app._neon_panels:
-        widget.configure(highlightbackground=flash_color)
+        set_panel_border(app, widget, flash_color)
 
 
 # -- Header glitch effect -------------------------------------------------
@@ -516,52 +594,47 @@ def _header_glitch_end(app):
 
 def snapshot_feed_counts(app):
     """Capture unread counts before refresh to detect new articles."""
-    feeds = app.storage.get_feeds()
-    app._pre_refresh_counts = {
-        feed["id"]: app.storage.get_article_count(feed["id"], unread_only=True)
-        for feed in feeds
-    }
+    app._pre_refresh_counts = app.storage.get_all_unread_counts()
 
 
 def detect_new_article_feeds(app):
     """Start glow on feeds that received new articles."""
-    feeds = app.storage.get_feeds()
-    for feed in feeds:
+    counts = app.storage.get_all_unread_counts()
+    for feed in app.storage.get_feeds():
         old_count = app._pre_refresh_counts.get(feed["id"], 0)
-        new_count = app.storage.get_article_count(feed["id"], unread_only=True)
+        new_count = counts.get(feed["id"], 0)
         if new_count > old_count:
             iid = f"feed_{feed['id']}"
-            app._glowing_feeds[iid] = (app._anim_frame + 90) % 3600
+            app._glowing_feeds[iid] = app._anim_frame + 90
+            # All glowing rows share one tag; tag each row once here and
+            # let animate_feed_glows recolor the tag itself
+            try:
+                tags = list(app.feeds_tree.item(iid, "tags") or ())
+                if "glow" not in tags:
+                    app.feeds_tree.item(iid, tags=tags + ["glow"])
+            except tk.TclError:
+                del app._glowing_feeds[iid]
+    if app._glowing_feeds:
+        app._active_anims.add("feed_glow")
 
 
 def animate_feed_glows(app):
     """Pulse foreground color of feeds with new articles."""
     if not app._glowing_feeds:
+        app._active_anims.discard("feed_glow")
         return
-    expired = []
-    t_val = (math.sin(app._anim_frame * (2 * math.pi / 60)) + 1) / 2
-    color = lerp_color(DARK_THEME["cyan_dim"], DARK_THEME["cyan"], t_val)
-    for iid, end_frame in app._glowing_feeds.items():
-        if app._anim_frame == end_frame:
-            expired.append(iid)
-            continue
-        try:
-            tag_name = f"glow_{iid}"
-            app.feeds_tree.tag_configure(tag_name, foreground=color)
-            current_tags = list(app.feeds_tree.item(iid, "tags") or ())
-            if tag_name not in current_tags:
-                current_tags.append(tag_name)
-                app.feeds_tree.item(iid, tags=current_tags)
-        except tk.TclError:
-            expired.append(iid)
+    t_val = sine_wave(app._anim_frame, 60)
+    app.feeds_tree.tag_configure("glow", foreground=lerp_color(
+        DARK_THEME["cyan_dim"], DARK_THEME["cyan"], t_val))
+    expired = [iid for iid, end_frame in app._glowing_feeds.items()
+               if app._anim_frame >= end_frame]
     for iid in expired:
         del app._glowing_feeds[iid]
         try:
-            tag_name = f"glow_{iid}"
-            current_tags = list(app.feeds_tree.item(iid, "tags") or ())
-            if tag_name in current_tags:
-                current_tags.remove(tag_name)
-                app.feeds_tree.item(iid, tags=current_tags)
+            tags = list(app.feeds_tree.item(iid, "tags") or ())
+            if "glow" in tags:
+                tags.remove("glow")
+                app.feeds_tree.item(iid, tags=tags)
         except tk.TclError:
             pass
 
@@ -572,17 +645,23 @@ def start_typewriter(app, text, article_id):
     """Begin typewriter animation for article preview."""
     cancel_typewriter(app)
     app._typewriter_active = True
+    app._active_anims.add("typewriter")
     app._typewriter_full_text = text
     app._typewriter_words = text.split(" ")
     app._typewriter_pos = 0
+    app._typewriter_text = ""
+    app._typewriter_spans = ()
     app._typewriter_article_id = article_id
 
 
 def cancel_typewriter(app):
     """Cancel in-progress typewriter animation."""
     app._typewriter_active = False
+    app._active_anims.discard("typewriter")
     app._typewriter_words = []
     app._typewriter_pos = 0
+    app._typewriter_text = ""
+    app._typewriter_spans = ()
     app._typewriter_article_id = None
     app._typewriter_pending_highlight = False
     app._typewriter_full_text = ""
@@ -600,14 +679,19 @@ def animate_typewriter(app):
     if app._typewriter_pos >= len(app._typewriter_words):
         finish_typewriter(app)
         return
-    end_pos = min(app._typewriter_pos + app._typewriter_chunk_size,
+    start_pos = app._typewriter_pos
+    end_pos = min(start_pos + app._typewriter_chunk_size,
                   len(app._typewriter_words))
     app._typewriter_pos = end_pos
-    # Rebuild text from words typed so far, apply full highlighting
-    partial_text = " ".join(app._typewriter_words[:app._typewriter_pos])
+    # Append only the new words; highlighting is retagged where it changed
+    chunk = " ".join(app._typewriter_words[start_pos:end_pos])
     app.preview_text.configure(state=tk.NORMAL)
-    app.preview_text.delete("1.0", tk.END)
-    highlighting.apply_highlighting(app, app.preview_text, partial_text)
+    if start_pos == 0:
+        app.preview_text.delete("1.0", tk.END)
+    else:
+        chunk = " " + chunk
+    highlighting.append_highlighting(app, app.preview_text, app._typewriter_text, chunk)
+    app._typewriter_text += chunk
     app.preview_text.configure(state=tk.DISABLED)
     app.preview_text.see(tk.END)
 
@@ -615,6 +699,7 @@ def animate_typewriter(app):
 def finish_typewriter(app):
     """Finalize typewriter -- add related articles."""
     app._typewriter_active = False
+    app._active_anims.discard("typewriter")
     # Clear previous related article targets
     app._related_article_targets = {}
 
@@ -628,10 +713,13 @@ def finish_typewriter(app):
             start = app.preview_text.index(tk.END)
             app.preview_text.insert(tk.END, "\n\n─── RELATED ARTICLES ───\n───── Click to Read ─────\n\n")
             app.preview_text.tag_add("related_header", start, tk.END)
-            app.preview_text.tag_add("related_header", start, tk.END)
 
-            # Related items in yellow (clickable)
-            for i, related in enumerate(cluster["articles"][1:]):
+            # Related items in yellow (clickable) -- build the whole block in
+            # Python and insert it once, tagging each item by line number
+            line = int(app.preview_text.index("end-1c").split(".")[0])
+            texts = []
+            spans = []
+            for related in cluster["articles"][1:]:
                 source = related.get("feed_name", "Unknown")
                 score = related.get("noise_score", 0)
                 related_id = related.get("id")
@@ -648,15 +736,15 @@ def finish_typewriter(app):
                     foreground=DARK_THEME["neon_yellow"]
                 )
 
-                # Get position before insert
-                line_start = app.preview_text.index("end-1c")
-
-                # Insert the text
                 text = f"  [{source}] {related['title']} ({score})\n"
-                app.preview_text.insert(tk.END, text)
-
-                # Apply tag to the inserted text
-                line_end = app.preview_text.index("end-1c")
+                texts.append(text)
+                # Titles may carry embedded newlines, so count them
+                next_line = line + text.count("\n")
+                spans.append((tag_name, f"{line}.0", f"{next_line}.0"))
+                line = next_line
+
+            app.preview_text.insert(tk.END, "".join(texts))
+            for tag_name, line_start, line_end in spans:
                 app.preview_text.tag_add(tag_name, line_start, line_end)
 
             app.preview_text.configure(state=tk.DISABLED)
@@ -693,13 +781,13 @@ def navigate_to_article(app, article_id):
     """Navigate to and display a specific article."""
     if not article_id:
         return
-    # Find and select the article in the tree
-    for item in app.articles_tree.get_children():
-        if int(item) == article_id:
-            app.articles_tree.selection_set(item)
-            app.articles_tree.see(item)
-            app._on_article_select(None)
-            return
+    # Rows use the article id as their iid, so select it directly if listed
+    iid = str(article_id)
+    if app.articles_tree.exists(iid):
+        app.articles_tree.selection_set(iid)
+        app.articles_tree.see(iid)
+        app._on_article_select(None)
+        return
     # Article not in current view - fetch and display directly
     article = app.storage.get_article(article_id)
     if article:
@@ -1043,7 +1131,7 @@ def animate_rain(app):
             col["drops"].remove(drop)
 
     # Fade placeholder text between cyan and magenta
-    t_val = (math.sin(app._anim_frame * (2 * math.pi / 180)) + 1) / 2
+    t_val = sine_wave(app._anim_frame, 180)
     ph_color = lerp_color(DARK_THEME["cyan"], DARK_THEME["magenta"], t_val)
     for item_id in canvas.find_withtag("placeholder"):
         item_type = canvas.type(item_id)
@@ -4,17 +4,19 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 import webbrowser
 import threading
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Optional
-from urllib.parse import urlparse
+from urllib.parse import urlparse, quote
 import io
 import math
 import random
 import re
-from collections import Counter
+from collections import Counter, OrderedDict
 import sys
 import os
-import socket
 
 # Sound support (Windows)
 try:
@@ -41,6 +43,79 @@ from dialogs import AddFeedDialog, ManageFeedsDialog, FilterKeywordsDialog, Cred
 import mbfc
 
 
+# Feed subdomains whose favicon lives on a different host
+_FAVICON_SUBDOMAINS = {
+    "feeds.npr.org": "npr.org",
+    "feeds.bbci.co.uk": "bbc.com",
+    "rss.nytimes.com": "nytimes.com",
+    "feeds.washingtonpost.com": "washingtonpost.com",
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _favicon_domain(feed_url: str) -> str:
+    """Extract the domain for favicon fetching, handling special cases."""
+    try:
+        parsed = urlparse(feed_url)
+        domain = parsed.netloc.lower()
+
+        # Handle Google News RSS proxy - extract real domain from query
+        if "news.google.com" in domain:
+            # URL like: news.google.com/rss/search?q=when:24h+allinurl:apnews.com
+            query = parsed.query
+            if "allinurl:" in query:
+                # Extract domain after allinurl:
+                start = query.find("allinurl:") + 9
+                end = query.find("&", start)
+                real_domain = query[start:end] if end > start else query[start:]
+                return real_domain.strip()
+
+        # Handle feed subdomains
+        if domain in _FAVICON_SUBDOMAINS:
+            return _FAVICON_SUBDOMAINS[domain]
+
+        # Remove 'feeds.' or 'rss.' prefix if present
+        if domain.startswith("feeds."):
+            domain = domain[6:]
+        elif domain.startswith("rss."):
+            domain = domain[4:]
+
+        return domain
+    except:
+        return ""
+
+
+def _decode_favicon(data: bytes):
+    """Decode favicon bytes to a 16x16 PIL image, or None if unreadable."""
+    # Pure PIL work, safe off the UI thread; PhotoImage creation is not
+    try:
+        img = Image.open(io.BytesIO(data))
+        return img.resize((16, 16), Image.Resampling.LANCZOS)
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _published_timestamp(published: str) -> Optional[float]:
+    """Parse an article's ISO published string to epoch seconds, or None."""
+    # Rows are redrawn on every refresh with the same strings, so parse each once
+    try:
+        return datetime.fromisoformat(published).timestamp()
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+
+
+# Author byline cleanup patterns, used by _clean_author_name
+_EMAIL_PAREN_RE = re.compile(r'^(.*?)\s*\(.*?@.*?\)\s*$')
+_PAREN_EMAIL_RE = re.compile(r'^.*?@.*?\s*\((.*?)\)\s*$')
+_AND_SPLIT_RE = re.compile(r'\s+and\s+', re.IGNORECASE)
+_AUTHOR_PREFIX_RE = re.compile(r'^(?:By|by|BY|Written by|Author:|AUTHOR:) ')
+# Bylines containing any of these (anywhere, case-insensitive) are organizations
+_ORG_RE = re.compile(
+    r'staff|desk|team|editorial|newsroom|correspondent|reporter|editor|bureau'
+    r'|agency|press|news|associated|reuters|media', re.IGNORECASE)
+
+
 class NewsAggregatorApp:
     def __init__(self, root: tk.Tk):
         # Windows: set AppUserModelID so taskbar uses our icon instead of python.exe's
@@ -75,6 +150,9 @@ class NewsAggregatorApp:
         self.feed_manager = FeedManager()
         self.filter_engine = FilterEngine(self.storage.get_filter_keywords())
         mbfc.load_mbfc_data()
+        # Shared pool for feed downloads (full refreshes and single-feed fetches)
+        self._fetch_pool = ThreadPoolExecutor(
+            max_workers=max(1, int(self.storage.get_setting("fetch_workers", "8"))))
 
         # State
         self.current_feed_id = None  # None = All feeds
@@ -82,9 +160,36 @@ class NewsAggregatorApp:
         self.selected_article_id = None
         self.current_author_url = None
         self.is_fetching = False
+        # Latest fetch progress from the worker; one idle flush applies it
+        self._progress_latest = 0
+        self._progress_pending = False
         self.auto_refresh_job = None
+        # refresh_articles coalesces into one idle rebuild; the serial lets the
+        # rebuild tell whether a newer status message was posted meanwhile
+        self._articles_refresh_pending = False
+        self._articles_refresh_status_mark = 0
+        self._status_serial = 0
+        self._search_debounce_job = None
+        # Feeds + articles rebuild requested by fetches and read-state changes
+        self._refresh_pending = False
+        self._refresh_status_mark = 0
         self.cluster_map = {}  # Maps article_id -> cluster info for expanding
+        # Recent refresh_articles results keyed by query parameters (LRU, 4 entries)
+        self._articles_cache = OrderedDict()
+        # Per-domain publisher trend stats, reloaded when stored scores change
+        self._pub_trend_cache = {}
+        self._pub_trend_version = None
         self.feed_icons = {}  # Cache for PhotoImage objects
+        self._feed_unread_counts = {}  # feed_id -> unread count as last listed
+        # published string -> age label, valid for one wall-clock minute
+        self._reltime_cache = {}
+        self._reltime_bucket = None
+        self._feed_names = {}  # feed_id -> name for listed feeds
+        self._favicons_preloaded = False  # Set once the startup decode pass lands
+        # Favicon downloads share one HTTP session and a small pool, made on first use
+        self._http = None
+        self._favicon_pool = None
+        self._favicon_inflight = set()
         self._articles_tab = "all"  # "all" or "favorites"
 
         # Ticker state
@@ -104,12 +209,23 @@ class NewsAggregatorApp:
         self._anim_id = None
         self._bias_arrow_pos = 0.5
         self._neon_panels = []
+        # Last color applied per widget/item, so unchanged frames skip the Tcl call
+        self._panel_border_colors = {}
+        self._border_fills = []
+        self._title_glow_color = None
+        self._cursor_visible = None
         self._is_maximized = False
         self._normal_geometry = ""
         self._drag_start_x = 0
         self._drag_start_y = 0
         self._drag_win_x = 0
         self._drag_win_y = 0
+        self._pending_move = None
+        self._pending_resize = None
+
+        # Transient effects currently running ("glitch", "sash_flash",
+        # "feed_glow", "typewriter"); anim_tick skips anything not listed
+        self._active_anims = set()
 
         # Gradient image cache (prevent GC of PhotoImages)
         self._gradient_cache = {}
@@ -139,6 +255,8 @@ class NewsAggregatorApp:
         self._typewriter_article_id = None
         self._typewriter_pending_highlight = False
         self._typewriter_full_text = ""
+        self._typewriter_text = ""  # Text typed into the preview so far
+        self._typewriter_spans = ()  # Highlight spans for _typewriter_text
 
         # Matrix rain effect (preview placeholder)
         self._rain_active = False
@@ -184,6 +302,9 @@ class NewsAggregatorApp:
         self._idle_message_index = 0
         self._idle_char_pos = 0
         self._idle_display_frames = 0  # How long to show completed message
+        # Display intervals: 3s, 5s, 7s, 9s, 12s (at 30fps), in shuffled order
+        self._idle_durations = random.sample([90, 150, 210, 270, 360], 5)
+        self._idle_duration_index = 0
         self._idle_last_real_status = ""
         self._idle_pause_until = 0  # Frame to resume idle cycling
 
@@ -207,9 +328,10 @@ class NewsAggregatorApp:
             (self.preview_frame, "magenta", 150),  # ~5s cycle
         ]
 
-        # Load initial data
+        # Load initial data; stored favicons decode off-thread and fill in after
         self.refresh_feeds_list()
         self.refresh_articles()
+        self._preload_favicons()
 
         # Cleanup old articles if 48+ hours since last cleanup
         self._auto_cleanup_old_articles()
@@ -337,7 +459,13 @@ class NewsAggregatorApp:
                 if "read" not in tags:
                     tags.append("read")
                 self.articles_tree.item(item_id, tags=tuple(tags))
-            self.refresh_feeds_list()
+            # One article changed; relabel its feed instead of rebuilding the list
+            feed_id = article.get("feed_id")
+            if feed_id in self._feed_unread_counts:
+                self._feed_unread_counts[feed_id] = max(0, self._feed_unread_counts[feed_id] - 1)
+                self._update_feed_labels(feed_id)
+            else:
+                self.refresh_feeds_list()
 
         self.preview_title.configure(text=article["title"])
 
@@ -349,7 +477,7 @@ class NewsAggregatorApp:
             self.bias_label.configure(text=bias or "Unknown", fg=DARK_THEME["fg"],
                                        bg=DARK_THEME["bg_tertiary"])
 
-        mbfc_source = mbfc.lookup_source(article.get("link", ""))
+        mbfc_source = mbfc.lookup_article_source(article)
         factual = mbfc.map_reporting_to_wirefeedr(
             mbfc_source.get("reporting", "")) if mbfc_source else ""
         factual = factual or article.get("factual", "")
@@ -392,63 +520,68 @@ class NewsAggregatorApp:
 
     def _get_favicon_domain(self, feed_url: str) -> str:
         """Extract the domain for favicon fetching, handling special cases."""
-        try:
-            parsed = urlparse(feed_url)
-            domain = parsed.netloc.lower()
-
-            # Handle Google News RSS proxy - extract real domain from query
-            if "news.google.com" in domain:
-                # URL like: news.google.com/rss/search?q=when:24h+allinurl:apnews.com
-                query = parsed.query
-                if "allinurl:" in query:
-                    # Extract domain after allinurl:
-                    start = query.find("allinurl:") + 9
-                    end = query.find("&", start)
-                    real_domain = query[start:end] if end > start else query[start:]
-                    return real_domain.strip()
-
-            # Handle feed subdomains
-            subdomain_mappings = {
-                "feeds.npr.org": "npr.org",
-                "feeds.bbci.co.uk": "bbc.com",
-                "rss.nytimes.com": "nytimes.com",
-                "feeds.washingtonpost.com": "washingtonpost.com",
-            }
-            if domain in subdomain_mappings:
-                return subdomain_mappings[domain]
-
-            # Remove 'feeds.' or 'rss.' prefix if present
-            if domain.startswith("feeds."):
-                domain = domain[6:]
-            elif domain.startswith("rss."):
-                domain = domain[4:]
-
-            return domain
-        except:
-            return ""
+        return _favicon_domain(feed_url)
 
     def _fetch_favicon(self, feed_id: int, feed_url: str):
-        """Fetch favicon for a feed in background thread."""
+        """Fetch favicon for a feed in the background favicon pool."""
         domain = self._get_favicon_domain(feed_url)
-        if not domain:
+        if not domain or feed_id in self._favicon_inflight:
             return
 
+        if self._favicon_pool is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            # One keep-alive session so every favicon reuses the same TLS connection
+            self._http = requests.Session()
+            self._http.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+            self._favicon_pool = ThreadPoolExecutor(max_workers=6)
+
         def fetch():
             try:
-                import requests
                 # Use Google's favicon service
                 favicon_url = f"https://www.google.com/s2/favicons?domain={domain}&sz=16"
-                response = requests.get(favicon_url, timeout=5)
+                response = self._http.get(favicon_url, timeout=5)
                 if response.status_code == 200:
                     self.storage.set_feed_favicon(feed_id, response.content)
-                    # Schedule UI update on main thread
-                    self.root.after(0, self.refresh_feeds_list)
+                    # Decode here; only the PhotoImage has to be made on the main thread
+                    img = _decode_favicon(response.content)
+                    if img is not None:
+                        self.root.after(0, lambda: self._install_favicons({feed_id: img}))
             except:
                 pass  # Silently fail
+            finally:
+                self._favicon_inflight.discard(feed_id)
+
+        self._favicon_inflight.add(feed_id)
+        self._favicon_pool.submit(fetch)
+
+    def _preload_favicons(self):
+        """Decode every stored favicon in the background."""
+        def decode_all():
+            decoded = {}
+            try:
+                for feed_id, data in self.storage.get_all_favicons().items():
+                    img = _decode_favicon(data)
+                    if img is not None:
+                        decoded[feed_id] = img
+            except Exception:
+                pass
+            self.root.after(0, lambda: self._install_favicons(decoded, preload=True))
 
-        thread = threading.Thread(target=fetch, daemon=True)
+        thread = threading.Thread(target=decode_all, daemon=True)
         thread.start()
 
+    def _install_favicons(self, decoded: dict, preload: bool = False):
+        """Wrap decoded favicons as PhotoImages and set them on their feed rows."""
+        if preload:
+            self._favicons_preloaded = True
+        for feed_id, img in decoded.items():
+            photo = ImageTk.PhotoImage(img)
+            self.feed_icons[feed_id] = photo
+            iid = f"feed_{feed_id}"
+            if self.feeds_tree.exists(iid):
+                self.feeds_tree.item(iid, image=photo)
+
     def _load_favicon_image(self, feed_id: int) -> Optional[tk.PhotoImage]:
         """Load favicon from database as PhotoImage, scaled to 16x16."""
         if feed_id in self.feed_icons:
@@ -484,16 +617,23 @@ class NewsAggregatorApp:
 
     def refresh_feeds_list(self):
         """Refresh the feeds treeview."""
-        self.feeds_tree.delete(*self.feeds_tree.get_children())
+        # Clear in one Tcl command rather than round-tripping every iid through Python
+        self.feeds_tree.tk.eval(f"{self.feeds_tree} delete [{self.feeds_tree} children {{}}]")
+
+        # One grouped query for every feed's unread count
+        unread_counts = self.storage.get_all_unread_counts()
+        # Kept so single read-state changes can relabel rows in place
+        self._feed_unread_counts = unread_counts
+        self._feed_names = {}
 
         # Add "All Feeds" item
-        all_count = self.storage.get_article_count(unread_only=True)
+        all_count = sum(unread_counts.values())
         self.feeds_tree.insert("", tk.END, iid="all",
                                text=f"\u25c8 All Feeds ({all_count} unread)",
                                tags=("all_item",))
 
         # Group feeds by category
-        feeds = self.storage.get_feeds()
+        feeds = self.storage.get_feeds_with_favicon_flags()
         categories = {}
         for feed in feeds:
             cat = feed["category"]
@@ -507,28 +647,82 @@ class NewsAggregatorApp:
             self.feeds_tree.insert("", tk.END, iid=cat_iid, text=divider_text,
                                    tags=("cat_divider",))
             for feed in cat_feeds:
-                unread = self.storage.get_article_count(feed["id"], unread_only=True)
+                unread = unread_counts.get(feed["id"], 0)
+                self._feed_names[feed["id"]] = feed["name"]
                 text = f"  {feed['name']} ({unread})"
                 feed_tag = "feed_unread" if unread > 0 else "feed_item"
+                # Keep the new-article glow across list rebuilds
+                if f"feed_{feed['id']}" in self._glowing_feeds:
+                    feed_tags = (feed_tag, "glow")
+                else:
+                    feed_tags = (feed_tag,)
 
-                # Try to load favicon
-                icon = self._load_favicon_image(feed["id"])
+                # Try to load favicon; only touch the blob when one is stored
+                icon = self.feed_icons.get(feed["id"])
+                if icon is None and feed["has_favicon"] and self._favicons_preloaded:
+                    icon = self._load_favicon_image(feed["id"])
                 if icon:
                     self.feeds_tree.insert("", tk.END, iid=f"feed_{feed['id']}",
                                           text=text, image=icon,
-                                          tags=(feed_tag,))
+                                          tags=feed_tags)
                 else:
                     self.feeds_tree.insert("", tk.END, iid=f"feed_{feed['id']}",
-                                          text=text, tags=(feed_tag,))
+                                          text=text, tags=feed_tags)
                     # Fetch favicon in background if not cached
-                    if not self.storage.get_feed_favicon(feed["id"]):
+                    if not feed["has_favicon"]:
                         self._fetch_favicon(feed["id"], feed["url"])
 
         self._update_bias_balance()
 
-    def refresh_articles(self):
-        """Refresh the articles list."""
-        self.articles_tree.delete(*self.articles_tree.get_children())
+    def _update_feed_labels(self, feed_id: int):
+        """Redraw the unread count on one feed row and on "All Feeds"."""
+        counts = self._feed_unread_counts
+        self.feeds_tree.item("all", text=f"\u25c8 All Feeds ({sum(counts.values())} unread)")
+        iid = f"feed_{feed_id}"
+        if feed_id not in self._feed_names or not self.feeds_tree.exists(iid):
+            return
+        unread = counts.get(feed_id, 0)
+        # Swap only the unread styling tag; hover/glow stay as they are
+        tags = [t for t in self.feeds_tree.item(iid, "tags") or () if t not in ("feed_unread", "feed_item")]
+        tags.insert(0, "feed_unread" if unread > 0 else "feed_item")
+        self.feeds_tree.item(iid, text=f"  {self._feed_names[feed_id]} ({unread})", tags=tags)
+
+    def refresh_articles(self, status_mark: Optional[int] = None):
+        """Queue an articles list refresh; calls before the next idle run it once.
+
+        status_mark is the status serial the request was made at (default: now).
+        """
+        if self._articles_refresh_pending:
+            return
+        self._articles_refresh_pending = True
+        self._articles_refresh_status_mark = (self._status_serial if status_mark is None
+                                              else status_mark)
+        self.root.after_idle(self._flush_articles_refresh)
+
+    def _request_refresh(self):
+        """Schedule one feeds + articles rebuild, coalescing requests made within 150ms."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        # Marked now, so status messages posted after the request outlive the rebuild
+        self._refresh_status_mark = self._status_serial
+        self.root.after(150, self._do_refresh)
+
+    def _do_refresh(self):
+        """Run the scheduled feeds + articles rebuild."""
+        self._refresh_pending = False
+        self.refresh_feeds_list()
+        self.refresh_articles(status_mark=self._refresh_status_mark)
+
+    def _flush_articles_refresh(self):
+        """Run the queued articles list refresh."""
+        self._articles_refresh_pending = False
+        self._do_refresh_articles()
+
+    def _do_refresh_articles(self):
+        """Rebuild the articles list."""
+        # Clear in one Tcl command rather than round-tripping every iid through Python
+        self.articles_tree.tk.eval(f"{self.articles_tree} delete [{self.articles_tree} children {{}}]")
 
         include_read = self.show_read_var.get()
 
@@ -537,39 +731,54 @@ class NewsAggregatorApp:
         max_per_source = int(self._per_source_var.get())
         use_clustering = self._cluster_var.get()
 
-        # Build feed filter based on selection
-        category_feed_ids = None
-        if self.current_category:
-            feeds = self.storage.get_feeds()
-            category_feed_ids = [f["id"] for f in feeds if f["category"] == self.current_category]
-
         favorites_only = self._articles_tab == "favorites"
-
-        articles = self.storage.get_articles(
-            feed_id=self.current_feed_id,
-            feed_ids=category_feed_ids,
-            include_read=include_read,
-            favorites_only=favorites_only,
-            min_score=0,  # Show all scores, let user judge
-            recency_hours=recency_hours,
-            max_per_source=max_per_source
-        )
-
-        # Apply real-time search filter
-        search_term = self.search_var.get().strip().lower()
-        if search_term:
-            articles = [a for a in articles if search_term in a.get("title", "").lower()
-                        or search_term in a.get("summary", "").lower()]
+        search = self.search_var.get().strip()
+
+        # Reuse the last few query/cluster results while no article has changed;
+        # the minute bucket lets the recency cutoff move forward
+        cache_key = (self.storage.articles_version, int(time.time() // 60),
+                     self.current_feed_id, self.current_category, include_read,
+                     favorites_only, recency_hours, max_per_source, search)
+        entry = self._articles_cache.get(cache_key)
+        if entry is None:
+            # Build feed filter based on selection
+            category_feed_ids = None
+            if self.current_category:
+                feeds = self.storage.get_feeds()
+                category_feed_ids = [f["id"] for f in feeds if f["category"] == self.current_category]
+
+            articles = self.storage.get_articles(
+                feed_id=self.current_feed_id,
+                feed_ids=category_feed_ids,
+                include_read=include_read,
+                favorites_only=favorites_only,
+                min_score=0,  # Show all scores, let user judge
+                recency_hours=recency_hours,
+                max_per_source=max_per_source,
+                # Real-time search filter, applied in SQL
+                search=search
+            )
+            entry = self._articles_cache[cache_key] = {"articles": articles, "clusters": None}
+            while len(self._articles_cache) > 4:
+                self._articles_cache.popitem(last=False)
+        else:
+            self._articles_cache.move_to_end(cache_key)
+            articles = entry["articles"]
 
         # Apply clustering if enabled
         if use_clustering and self.current_feed_id is None:
-            clusters = self.filter_engine.cluster_articles(articles)
+            if entry["clusters"] is None:
+                entry["clusters"] = self.filter_engine.cluster_articles(articles)
+            clusters = entry["clusters"]
             self._display_clustered_articles(clusters)
             total_articles = sum(c["count"] for c in clusters)
-            self._update_status(f"Showing {len(clusters)} topics ({total_articles} articles)")
+            showing = f"Showing {len(clusters)} topics ({total_articles} articles)"
         else:
             self._display_flat_articles(articles)
-            self._update_status(f"Showing {len(articles)} articles")
+            showing = f"Showing {len(articles)} articles"
+        # Don't overwrite a status the caller posted after queuing the refresh
+        if self._status_serial == self._articles_refresh_status_mark:
+            self._update_status(showing)
 
         # Update read counter in articles frame title
         self._update_read_counter(articles)
@@ -604,46 +813,71 @@ class NewsAggregatorApp:
 
     def _display_flat_articles(self, articles: list):
         """Display articles without clustering."""
-        for article in articles:
-            self._insert_article_row(article)
+        now_ts = time.time()
+        self._insert_article_rows([self._article_row(article, now_ts=now_ts)
+                                   for article in articles])
 
     def _display_clustered_articles(self, clusters: list):
         """Display articles grouped by topic clusters."""
         self.cluster_map = {}
+        now_ts = time.time()
+        rows = []
         for cluster in clusters:
             primary = cluster["articles"][0]
             if cluster["count"] > 1:
                 title = f"[{cluster['count']}] {primary['title']}"
             else:
                 title = primary["title"]
-            self._insert_article_row(primary, title_override=title)
+            rows.append(self._article_row(primary, title_override=title, now_ts=now_ts))
             self.cluster_map[primary["id"]] = cluster
+        self._insert_article_rows(rows)
+
+    def _insert_article_rows(self, rows: list):
+        """Append prebuilt (iid, values, tags) rows to the articles treeview."""
+        # Straight Tcl calls skip ttk's per-insert option formatting
+        call = self.articles_tree.tk.call
+        tree = self.articles_tree._w
+        for iid, values, tags in rows:
+            call(tree, "insert", "", "end", "-id", iid, "-values", values, "-tags", tags)
+
+    def _relative_time(self, published: str, now_ts: float) -> str:
+        """Age label ("3h ago") for a published string, reused within the same minute."""
+        bucket = int(now_ts // 60)
+        if bucket != self._reltime_bucket:
+            self._reltime_bucket = bucket
+            self._reltime_cache = {}
+        label = self._reltime_cache.get(published)
+        if label is not None:
+            return label
+        label = published
+        published_ts = _published_timestamp(published)
+        if published_ts is not None:
+            hours = (now_ts - published_ts) / 3600
+            if hours < 1:
+                label = "Just Now"
+            elif hours < 24:
+                half = round(hours * 2) / 2
+                if half == int(half):
+                    label = f"{int(half)}h ago"
+                else:
+                    label = f"{int(half)}.5h ago"
+            elif hours < 168:
+                label = f"{int(hours // 24)}d ago"
+            else:
+                label = f"{int(hours // 168)}w ago"
+        self._reltime_cache[published] = label
+        return label
 
-    def _insert_article_row(self, article: dict, title_override: str = None):
-        """Insert a single article row into the treeview."""
+    def _article_row(self, article: dict, title_override: str = None,
+                     now_ts: float = None) -> tuple:
+        """Build the (iid, values, tags) treeview row for an article."""
         fav = "\u25c6" if article.get("is_favorite") else "\u25c7"
         title = title_override or article["title"]
         source = article.get("feed_name", "Unknown")
         bias = article.get("bias", "")
         date = article.get("published", "")
         if date:
-            try:
-                dt = datetime.fromisoformat(date)
-                hours = (datetime.now() - dt).total_seconds() / 3600
-                if hours < 1:
-                    date = "Just Now"
-                elif hours < 24:
-                    half = round(hours * 2) / 2
-                    if half == int(half):
-                        date = f"{int(half)}h ago"
-                    else:
-                        date = f"{int(half)}.5h ago"
-                elif hours < 168:
-                    date = f"{int(hours // 24)}d ago"
-                else:
-                    date = f"{int(hours // 168)}w ago"
-            except:
-                pass
+            date = self._relative_time(date, now_ts or time.time())
         noise = article.get("noise_score", 0)
         letter, label, color = get_grade(noise)
         noise_display = f"{noise} {label}"
@@ -653,9 +887,8 @@ class NewsAggregatorApp:
             tags.append("favorite")
         tags.append("read" if article.get("is_read", False) else "unread")
 
-        self.articles_tree.insert("", tk.END, iid=str(article["id"]),
-                                  values=(fav, title, source, bias, date, noise_display),
-                                  tags=tuple(tags))
+        return (str(article["id"]), (fav, title, source, bias, date, noise_display),
+                tuple(tags))
 
     # ── Fetch operations ─────────────────────────────────────────
 
@@ -677,66 +910,28 @@ class NewsAggregatorApp:
             feeds = self.storage.get_feeds()
             total = len(feeds)
             results = []
-
-            for i, feed in enumerate(feeds):
+            done = 0
+
+            # Network fetch/parse runs in the pool; scoring and SQLite writes stay
+            # on this thread as results complete
+            futures = {self._fetch_pool.submit(self.feed_manager.fetch_feed, feed["url"]): feed
+                       for feed in feeds}
+            for future in as_completed(futures):
+                feed = futures[future]
+                done += 1
                 try:
-                    result = self.feed_manager.fetch_feed(feed["url"])
+                    result = future.result()
                     if not result.get("success"):
                         results.append((feed["name"], 0, 0))
-                        percent = ((i + 1) / total) * 100
-                        self.root.after(0, lambda p=percent: self._update_progress(p))
-                        continue
-                    fetched = result.get("articles", [])
-                    new_count = 0
-                    for article in fetched:
-                        article["feed_id"] = feed["id"]
-                        article["bias"] = feed.get("bias", "")
-                        article["factual"] = feed.get("factual", "")
-                        # Attach MBFC data for article's actual publisher
-                        mbfc_source = mbfc.lookup_source(article.get("link", ""))
-                        if mbfc_source:
-                            article["mbfc"] = mbfc_source
-                        # Apply noise scoring (WRFDR-only, before blend)
-                        art_score = self.filter_engine.calculate_objectivity_score(
-                            title=article.get("title", ""),
-                            link=article.get("link", ""),
-                            summary=article.get("summary", ""),
-                            factual_rating=article.get("factual", "")
-                        )
-                        # Compute publisher credibility fields
-                        pub_score = mbfc.publisher_score(mbfc_source)
-                        domain = mbfc.normalize_domain(article.get("link", ""))
-                        # Blend with MBFC publisher reputation (40/60)
-                        article["noise_score"] = mbfc.composite_score(art_score, mbfc_source)
-                        # Extract raw MBFC strings for logging
-                        m_bias = mbfc_source.get("bias") if mbfc_source else None
-                        m_reporting = mbfc_source.get("reporting") if mbfc_source else None
-                        m_credibility = mbfc_source.get("credibility") if mbfc_source else None
-                        m_flags = ",".join(mbfc_source.get("questionable", [])) if mbfc_source and mbfc_source.get("questionable") else None
-                        if self.storage.add_article(
-                            feed_id=article["feed_id"],
-                            title=article["title"],
-                            link=article["link"],
-                            summary=article.get("summary", ""),
-                            published=article.get("published"),
-                            author=article.get("author", ""),
-                            noise_score=article.get("noise_score", 0),
-                            publisher_domain=domain or None,
-                            article_score=art_score,
-                            publisher_score=pub_score,
-                            mbfc_bias=m_bias,
-                            mbfc_reporting=m_reporting,
-                            mbfc_credibility=m_credibility,
-                            mbfc_flags=m_flags,
-                        ):
-                            new_count += 1
-                    results.append((feed["name"], new_count, len(fetched)))
-                except Exception as e:
+                    else:
+                        new_count, fetched_count = self._store_fetched_articles(
+                            feed, result.get("articles", []))
+                        results.append((feed["name"], new_count, fetched_count))
+                except Exception:
                     results.append((feed["name"], 0, 0))
 
                 # Update progress
-                percent = ((i + 1) / total) * 100
-                self.root.after(0, lambda p=percent: self._update_progress(p))
+                self._post_progress((done / total) * 100)
 
             # Update UI on main thread
             def finish():
@@ -748,8 +943,7 @@ class NewsAggregatorApp:
                 total_new = sum(r[1] for r in results)
                 self._update_status(f"Fetched {total_new} new articles from {len(results)} feeds")
 
-                self.refresh_feeds_list()
-                self.refresh_articles()
+                self._request_refresh()
 
                 # Detect and glow feeds with new articles
                 animations.detect_new_article_feeds(self)
@@ -759,6 +953,68 @@ class NewsAggregatorApp:
         thread = threading.Thread(target=fetch_thread, daemon=True)
         thread.start()
 
+    def _store_fetched_articles(self, feed: dict, fetched: list) -> tuple:
+        """Score and store fetched articles for a feed; returns (new, fetched) counts."""
+        rows = []
+        # Resolve every link's domain and MBFC source in one pass, then score
+        # with locally bound helpers
+        links = [article.get("link", "") for article in fetched]
+        lookups = mbfc.lookup_sources_batch(links)
+        score_article = self.filter_engine.calculate_objectivity_score
+        publisher_score = mbfc.publisher_score
+        blend_scores = mbfc.blend_scores
+        feed_id = feed["id"]
+        factual = feed.get("factual", "")
+        pub_scores = {}
+        for article, link, (domain, mbfc_source) in zip(fetched, links, lookups):
+            title = article.get("title", "")
+            summary = article.get("summary", "")
+            # Apply noise scoring (WRFDR-only, before blend)
+            art_score = score_article(
+                title=title,
+                link=link,
+                summary=summary,
+                factual_rating=factual
+            )
+            # Compute publisher credibility fields (once per domain)
+            if domain in pub_scores:
+                pub_score = pub_scores[domain]
+            else:
+                pub_score = pub_scores[domain] = publisher_score(mbfc_source)
+            # Blend with MBFC publisher reputation (40/60)
+            noise_score = blend_scores(art_score, pub_score)
+            # Extract raw MBFC strings for logging
+            if mbfc_source:
+                m_bias = mbfc_source.get("bias")
+                m_reporting = mbfc_source.get("reporting")
+                m_credibility = mbfc_source.get("credibility")
+                questionable = mbfc_source.get("questionable")
+                m_flags = ",".join(questionable) if questionable else None
+            else:
+                m_bias = m_reporting = m_credibility = m_flags = None
+            rows.append((
+                feed_id, title, link, summary, article.get("published"),
+                article.get("author", ""), noise_score,
+                domain or None, art_score, pub_score,
+                m_bias, m_reporting, m_credibility, m_flags,
+            ))
+        # One transaction per feed instead of a commit per article
+        new_count = self.storage.add_articles_bulk(rows)
+        return new_count, len(fetched)
+
+    def _post_progress(self, percent: float):
+        """Record fetch progress from a worker, coalescing UI updates."""
+        self._progress_latest = percent
+        if not self._progress_pending:
+            self._progress_pending = True
+            self.root.after_idle(self._flush_progress)
+
+    def _flush_progress(self):
+        """Apply the most recent posted fetch progress."""
+        # Clear first so a post racing with this flush schedules another one
+        self._progress_pending = False
+        self._update_progress(self._progress_latest)
+
     def _play_refresh_sound(self):
         """Play refresh sound effect."""
         if not HAS_WINSOUND:
@@ -814,69 +1070,23 @@ class NewsAggregatorApp:
                     self.root.after(0, lambda: self._update_status(
                         f"Error fetching {feed['name']}: {result.get('error', 'Unknown error')}"))
                     return
-                fetched = result.get("articles", [])
-                new_count = 0
-                for article in fetched:
-                    article["feed_id"] = feed_id
-                    article["bias"] = feed.get("bias", "")
-                    article["factual"] = feed.get("factual", "")
-                    # Attach MBFC data for article's actual publisher
-                    mbfc_source = mbfc.lookup_source(article.get("link", ""))
-                    if mbfc_source:
-                        article["mbfc"] = mbfc_source
-                    # Apply noise scoring (WRFDR-only, before blend)
-                    art_score = self.filter_engine.calculate_objectivity_score(
-                        title=article.get("title", ""),
-                        link=article.get("link", ""),
-                        summary=article.get("summary", ""),
-                        factual_rating=article.get("factual", "")
-                    )
-                    # Compute publisher credibility fields
-                    pub_score = mbfc.publisher_score(mbfc_source)
-                    domain = mbfc.normalize_domain(article.get("link", ""))
-                    # Blend with MBFC publisher reputation (40/60)
-                    article["noise_score"] = mbfc.composite_score(art_score, mbfc_source)
-                    # Extract raw MBFC strings for logging
-                    m_bias = mbfc_source.get("bias") if mbfc_source else None
-                    m_reporting = mbfc_source.get("reporting") if mbfc_source else None
-                    m_credibility = mbfc_source.get("credibility") if mbfc_source else None
-                    m_flags = ",".join(mbfc_source.get("questionable", [])) if mbfc_source and mbfc_source.get("questionable") else None
-                    if self.storage.add_article(
-                        feed_id=article["feed_id"],
-                        title=article["title"],
-                        link=article["link"],
-                        summary=article.get("summary", ""),
-                        published=article.get("published"),
-                        author=article.get("author", ""),
-                        noise_score=article.get("noise_score", 0),
-                        publisher_domain=domain or None,
-                        article_score=art_score,
-                        publisher_score=pub_score,
-                        mbfc_bias=m_bias,
-                        mbfc_reporting=m_reporting,
-                        mbfc_credibility=m_credibility,
-                        mbfc_flags=m_flags,
-                    ):
-                        new_count += 1
+                new_count, _ = self._store_fetched_articles(feed, result.get("articles", []))
 
                 def finish():
                     self._update_status(f"Fetched {new_count} new articles from {feed['name']}")
-                    self.refresh_feeds_list()
-                    self.refresh_articles()
+                    self._request_refresh()
 
                 self.root.after(0, finish)
             except Exception as e:
                 self.root.after(0, lambda: self._update_status(f"Error fetching {feed['name']}: {e}"))
 
-        thread = threading.Thread(target=fetch_thread, daemon=True)
-        thread.start()
+        self._fetch_pool.submit(fetch_thread)
 
     def mark_all_read(self):
         """Mark all visible articles as read."""
         for item in self.articles_tree.get_children():
             self.storage.mark_article_read(int(item))
-        self.refresh_feeds_list()
-        self.refresh_articles()
+        self._request_refresh()
         self._update_status("Marked all articles as read")
 
     def open_in_browser(self):
@@ -887,8 +1097,7 @@ class NewsAggregatorApp:
                 webbrowser.open(article["link"])
                 if not article["is_read"]:
                     self.storage.mark_article_read(self.selected_article_id)
-                    self.refresh_feeds_list()
-                    self.refresh_articles()
+                    self._request_refresh()
 
     def _clean_author_name(self, author: str) -> Optional[str]:
         """Extract a clean author name from various feed formats."""
@@ -896,21 +1105,19 @@ class NewsAggregatorApp:
             return None
 
         # Remove email patterns: "name (email)" or "email (name)" or just "email"
-        email_paren = re.match(r'^(.*?)\s*\(.*?@.*?\)\s*$', author)
+        email_paren = _EMAIL_PAREN_RE.match(author)
         if email_paren:
             author = email_paren.group(1).strip()
 
-        paren_email = re.match(r'^.*?@.*?\s*\((.*?)\)\s*$', author)
+        paren_email = _PAREN_EMAIL_RE.match(author)
         if paren_email:
             author = paren_email.group(1).strip()
 
         if '@' in author:
             return None
 
-        # Remove common prefixes
-        for prefix in ["By ", "by ", "BY ", "Written by ", "Author: ", "AUTHOR: "]:
-            if author.startswith(prefix):
-                author = author[len(prefix):]
+        # Remove a common prefix
+        author = _AUTHOR_PREFIX_RE.sub('', author, count=1)
 
         # Remove role suffixes after comma: "John Smith, Senior Reporter"
         if ',' in author:
@@ -918,17 +1125,14 @@ class NewsAggregatorApp:
 
         # Remove "and" joined multiple authors - just take first
         if ' and ' in author.lower():
-            author = re.split(r'\s+and\s+', author, flags=re.IGNORECASE)[0].strip()
+            author = _AND_SPLIT_RE.split(author, 1)[0].strip()
 
         # Skip if too short or doesn't look like a name
         if len(author) < 3 or not author[0].isupper():
             return None
 
         # Skip if it looks like an organization
-        org_keywords = ["staff", "desk", "team", "editorial", "newsroom", "correspondent",
-                       "reporter", "editor", "bureau", "agency", "press", "news",
-                       "associated", "reuters", "media"]
-        if any(kw in author.lower() for kw in org_keywords):
+        if _ORG_RE.search(author):
             return None
 
         return author.strip()
@@ -948,8 +1152,7 @@ class NewsAggregatorApp:
             self._update_status("Could not extract author name")
             return
 
-        import urllib.parse
-        query = urllib.parse.quote(author)
+        query = quote(author)
 
         urls = {
             "google": f"https://www.google.com/search?q={query}",
@@ -972,6 +1175,10 @@ class NewsAggregatorApp:
     def clear_search(self):
         """Clear search filter."""
         self.search_var.set("")
+        # Refresh now rather than after the debounce the var write just queued
+        if self._search_debounce_job is not None:
+            self.root.after_cancel(self._search_debounce_job)
+            self._search_debounce_job = None
         self.refresh_articles()
 
     def show_delete_old_dialog(self):
@@ -1131,8 +1338,7 @@ class NewsAggregatorApp:
     def _mark_feed_read(self, feed_id: int):
         """Mark all articles in a feed as read."""
         self.storage.mark_feed_read(feed_id)
-        self.refresh_feeds_list()
-        self.refresh_articles()
+        self._request_refresh()
         self._update_status("Marked feed as read")
 
     def _remove_feed(self, feed_id: int):
@@ -1205,20 +1411,7 @@ class NewsAggregatorApp:
         if not article:
             return
 
-        # Mark as read
-        if not article["is_read"]:
-            self.storage.mark_article_read(article_id)
-            tags = list(self.articles_tree.item(str(article_id), "tags") or ())
-            if "unread" in tags:
-                tags.remove("unread")
-            if "read" not in tags:
-                tags.append("read")
-            self.articles_tree.item(str(article_id), tags=tuple(tags))
-            self.refresh_feeds_list()
-
-        # Update preview
-        self.preview_title.configure(text=article["title"])
-
+        # Marks the article read and relabels its feed
         self._display_article(article)
 
     def _on_article_double_click(self, event):
@@ -1250,8 +1443,7 @@ class NewsAggregatorApp:
 
     def _toggle_read(self, article_id: int, is_read: bool):
         self.storage.mark_article_read(article_id, not is_read)
-        self.refresh_feeds_list()
-        self.refresh_articles()
+        self._request_refresh()
 
     def _hide_article(self, article_id: int):
         self.storage.hide_article(article_id)
@@ -1271,6 +1463,16 @@ class NewsAggregatorApp:
         self.refresh_articles()
 
     def _on_search_changed(self, *args):
+        self._schedule_search_refresh()
+
+    def _schedule_search_refresh(self):
+        """Refresh articles once typing in the filter box pauses."""
+        if self._search_debounce_job is not None:
+            self.root.after_cancel(self._search_debounce_job)
+        self._search_debounce_job = self.root.after(150, self._run_search_refresh)
+
+    def _run_search_refresh(self):
+        self._search_debounce_job = None
         self.refresh_articles()
 
     def _schedule_auto_refresh(self):
@@ -1289,6 +1491,7 @@ class NewsAggregatorApp:
 
     def _update_status(self, message: str):
         """Update the status bar with a real message, pausing idle cycling."""
+        self._status_serial += 1
         self.status_bar.configure(text=f"... {message.upper()}")
         self._idle_active = False
         self._idle_last_real_status = message.upper()
@@ -1382,21 +1585,31 @@ class NewsAggregatorApp:
             return
         self._score_click_article_id = article_id
         self._show_score_status(article)
-        mbfc_source = mbfc.lookup_source(article.get("link", ""))
+        mbfc_source = mbfc.lookup_article_source(article)
         cleaned_author = self._clean_author_name(article.get("author", ""))
         CredibilityDetailDialog(self.root, article, mbfc_source,
                                 storage=self.storage,
                                 cleaned_author=cleaned_author)
 
+    def _publisher_trend(self, domain: str) -> Optional[dict]:
+        """Trend stats for a publisher domain from the prefetched per-domain map."""
+        if not domain:
+            return None
+        version = self.storage.scores_version
+        if self._pub_trend_version != version:
+            self._pub_trend_cache = self.storage.get_all_publisher_trends()
+            self._pub_trend_version = version
+        return self._pub_trend_cache.get(domain)
+
     def _show_score_status(self, article: dict):
         """Display score breakdown in status bar for an article."""
         noise = article.get("noise_score", 0)
         letter, label, color = get_grade(noise)
-        mbfc_source = mbfc.lookup_source(article.get("link", ""))
+        mbfc_source = mbfc.lookup_article_source(article)
 
         # Check for anomaly
         domain = article.get("publisher_domain", "")
-        pub_trend = self.storage.get_publisher_trend_data(domain) if domain else None
+        pub_trend = self._publisher_trend(domain)
         anomaly_suffix = " \u26a0 ANOMALY" if Storage.is_anomaly(noise, pub_trend) else ""
 
         if mbfc_source:
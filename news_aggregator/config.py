@@ -280,6 +280,7 @@ DEFAULT_SETTINGS = {
     "recency_hours": 24,  # Only show articles from last N hours (0 = no limit)
     "max_per_source": 10,  # Max articles per feed (0 = no limit), ranked by quality
     "cluster_topics": True,  # Group similar articles into topic clusters
+    "fetch_workers": 8,  # Parallel feed downloads during refresh
 }
 
 # Database settings
@@ -1,8 +1,7 @@
 # dialogs.py - Dialog windows and instance management
 
 import tkinter as tk
-from tkinter import ttk, messagebox
-import socket
+from tkinter import ttk
 import threading
 import webbrowser
 
@@ -13,6 +12,11 @@ from constants import SINGLE_INSTANCE_PORT
 import mbfc
 import animations
 
+# AddFeedDialog status label colors
+_STATUS_OK = "#44ff44"
+_STATUS_ERROR = "#ff4444"
+_STATUS_INFO = DARK_THEME["fg_secondary"]
+
 
 class AddFeedDialog:
     """Dialog for adding a new feed."""
@@ -20,37 +24,27 @@ class AddFeedDialog:
     def __init__(self, parent, feed_manager: FeedManager):
         self.result = None
         self.feed_manager = feed_manager
+        self._validate_cache = {}  # url -> successful validate_feed_url result
+        self._validating = False  # A background validation is in flight
 
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Add Feed")
-        self.dialog.geometry("500x200")
+        # Size and place next to the parent in one geometry call
+        self.dialog.geometry(f"500x200+{parent.winfo_x() + 100}+{parent.winfo_y() + 100}")
         self.dialog.transient(parent)
         self.dialog.grab_set()
         self.dialog.configure(bg=DARK_THEME["bg"])
 
-        # Center on parent
-        self.dialog.geometry(f"+{parent.winfo_x() + 100}+{parent.winfo_y() + 100}")
-
-        frame = ttk.Frame(self.dialog, padding=20)
+        frame = ttk.Frame(self.dialog, style="DialogWide.TFrame")
         frame.pack(fill=tk.BOTH, expand=True)
 
-        # URL
-        ttk.Label(frame, text="Feed URL:").grid(row=0, column=0, sticky=tk.W, pady=5)
+        # URL, name and category rows
         self.url_var = tk.StringVar()
-        self.url_entry = ttk.Entry(frame, textvariable=self.url_var, width=50)
-        self.url_entry.grid(row=0, column=1, sticky=tk.EW, pady=5)
-
-        # Name
-        ttk.Label(frame, text="Name:").grid(row=1, column=0, sticky=tk.W, pady=5)
+        self.url_entry = self._build_field(frame, 0, "Feed URL:", self.url_var)
         self.name_var = tk.StringVar()
-        self.name_entry = ttk.Entry(frame, textvariable=self.name_var, width=50)
-        self.name_entry.grid(row=1, column=1, sticky=tk.EW, pady=5)
-
-        # Category
-        ttk.Label(frame, text="Category:").grid(row=2, column=0, sticky=tk.W, pady=5)
+        self.name_entry = self._build_field(frame, 1, "Name:", self.name_var)
         self.category_var = tk.StringVar(value="Uncategorized")
-        self.category_entry = ttk.Entry(frame, textvariable=self.category_var, width=50)
-        self.category_entry.grid(row=2, column=1, sticky=tk.EW, pady=5)
+        self.category_entry = self._build_field(frame, 2, "Category:", self.category_var)
 
         # Buttons
         btn_frame = ttk.Frame(frame)
@@ -61,7 +55,9 @@ class AddFeedDialog:
         ttk.Button(btn_frame, text="Cancel", command=self.dialog.destroy).pack(side=tk.LEFT, padx=5)
 
         # Status
-        self.status_label = ttk.Label(frame, text="", foreground=DARK_THEME["fg_secondary"])
+        self._status_var = tk.StringVar()
+        self._status_color = _STATUS_INFO
+        self.status_label = ttk.Label(frame, textvariable=self._status_var, foreground=_STATUS_INFO)
         self.status_label.grid(row=4, column=0, columnspan=2)
 
         frame.columnconfigure(1, weight=1)
@@ -69,26 +65,68 @@ class AddFeedDialog:
 
         self.dialog.wait_window()
 
+    def _set_status(self, text, color):
+        """Show a status message, reconfiguring the label color only when it changes."""
+        self._status_var.set(text)
+        if color != self._status_color:
+            self._status_color = color
+            # Straight to Tcl; skips Widget.configure's option-dict conversion
+            self.status_label.tk.call(self.status_label, "configure", "-foreground", color)
+
+    @staticmethod
+    def _build_field(frame, row, label, var):
+        """Grid a label and entry pair on one row; return the entry."""
+        ttk.Label(frame, text=label).grid(row=row, column=0, sticky=tk.W, pady=5)
+        entry = ttk.Entry(frame, textvariable=var, width=50)
+        entry.grid(row=row, column=1, sticky=tk.EW, pady=5)
+        return entry
+
     def _validate(self):
         """Validate the feed URL."""
         url = self.url_var.get().strip()
         if not url:
-            self.status_label.configure(text="Please enter a URL", foreground="#ff4444")
+            self._set_status("Please enter a URL", _STATUS_ERROR)
             return
 
-        self.status_label.configure(text="Validating...", foreground=DARK_THEME["fg_secondary"])
-        self.dialog.update()
+        # Repeated clicks while a fetch is running would only start duplicates
+        if self._validating:
+            return
+
+        # Re-validating a URL that already checked out doesn't need another fetch
+        cached = self._validate_cache.get(url)
+        if cached is not None:
+            self._apply_validate_result(url, cached)
+            return
+
+        self._validating = True
+        self._set_status("Validating...", _STATUS_INFO)
+        # Fetching the feed can take seconds; keep the dialog responsive
+        threading.Thread(target=self._do_validate, args=(url,), daemon=True).start()
 
+    def _do_validate(self, url):
+        """Fetch and check the feed in a background thread."""
         result = self.feed_manager.validate_feed_url(url)
+        try:
+            self.dialog.after(0, lambda: self._apply_validate_result(url, result))
+        except (tk.TclError, RuntimeError):
+            pass  # Dialog closed while validating
+
+    def _apply_validate_result(self, url, result):
+        """Show a validation result on the main thread."""
+        self._validating = False
+        if not self.dialog.winfo_exists():
+            return
         if result["valid"]:
-            self.status_label.configure(
-                text=f"Valid feed: {result['feed_title']} ({result['article_count']} articles)",
-                foreground="#44ff44"
+            # Failures may be transient network errors, so only successes are kept
+            self._validate_cache[url] = result
+            self._set_status(
+                f"Valid feed: {result['feed_title']} ({result['article_count']} articles)",
+                _STATUS_OK
             )
             if not self.name_var.get():
                 self.name_var.set(result["feed_title"])
         else:
-            self.status_label.configure(text=f"Invalid: {result['error']}", foreground="#ff4444")
+            self._set_status(f"Invalid: {result['error']}", _STATUS_ERROR)
 
     def _add(self):
         """Add the feed."""
@@ -97,11 +135,11 @@ class AddFeedDialog:
         category = self.category_var.get().strip() or "Uncategorized"
 
         if not url:
-            self.status_label.configure(text="Please enter a URL", foreground="#ff4444")
+            self._set_status("Please enter a URL", _STATUS_ERROR)
             return
 
         if not name:
-            self.status_label.configure(text="Please enter a name", foreground="#ff4444")
+            self._set_status("Please enter a name", _STATUS_ERROR)
             return
 
         self.result = (name, url, category)
@@ -122,7 +160,7 @@ class ManageFeedsDialog:
         self.dialog.grab_set()
         self.dialog.configure(bg=DARK_THEME["bg"])
 
-        frame = ttk.Frame(self.dialog, padding=10)
+        frame = ttk.Frame(self.dialog, style="Dialog.TFrame")
         frame.pack(fill=tk.BOTH, expand=True)
 
         # Feeds list
@@ -141,32 +179,63 @@ class ManageFeedsDialog:
         self.tree.configure(yscrollcommand=scroll.set)
 
         # Buttons
-        btn_frame = ttk.Frame(self.dialog, padding=10)
+        btn_frame = ttk.Frame(self.dialog, style="Dialog.TFrame")
         btn_frame.pack(fill=tk.X)
 
-        ttk.Button(btn_frame, text="Remove Selected", command=self._remove).pack(side=tk.LEFT, padx=5)
+        self.remove_btn = ttk.Button(btn_frame, text="Remove Selected", command=self._remove)
+        self.remove_btn.pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Close", command=self.dialog.destroy).pack(side=tk.RIGHT, padx=5)
 
+        self._known_ids = set()  # iids currently shown in the tree
+        # Feed iid armed for removal by a first click, and its disarm timer
+        self._pending_remove = None
+        self._pending_remove_job = None
+        self.tree.bind("<<TreeviewSelect>>", lambda e: self._clear_pending_remove())
         self._refresh()
         self.dialog.wait_window()
 
     def _refresh(self):
-        """Refresh the feeds list."""
-        self.tree.delete(*self.tree.get_children())
-        for feed in self.storage.get_feeds(enabled_only=False):
-            self.tree.insert("", tk.END, iid=str(feed["id"]),
-                             values=(feed["name"], feed["category"], feed["url"]))
+        """Refresh the feeds list, only touching rows that were added or removed."""
+        feeds = {str(feed["id"]): feed for feed in self.storage.get_feed_listing()}
+        # ttk already defers redraw to idle, so one delete call per refresh
+        # is all the batching the tree needs
+        removed = self._known_ids - feeds.keys()
+        if removed:
+            self.tree.delete(*removed)
+        insert = self.tree.insert
+        for iid, feed in feeds.items():
+            if iid not in self._known_ids:
+                insert("", tk.END, iid=iid,
+                       values=(feed["name"], feed["category"], feed["url"]))
+        self._known_ids = set(feeds)
 
     def _remove(self):
-        """Remove selected feed."""
+        """Remove selected feed; the first click arms it, a second click confirms."""
         selection = self.tree.selection()
-        if selection:
-            feed_id = int(selection[0])
-            feed = self.storage.get_feed(feed_id)
-            if messagebox.askyesno("Confirm", f"Remove '{feed['name']}'?"):
-                self.storage.remove_feed(feed_id)
-                self.changed = True
-                self._refresh()
+        if not selection:
+            return
+        iid = selection[0]
+        if self._pending_remove != iid:
+            self._clear_pending_remove()
+            self._pending_remove = iid
+            self.remove_btn.configure(text="Click again to confirm")
+            self._pending_remove_job = self.dialog.after(2000, self._clear_pending_remove)
+            return
+        self._clear_pending_remove()
+        self.storage.remove_feed(int(iid))
+        self.changed = True
+        self.tree.delete(iid)
+        self._known_ids.discard(iid)
+
+    def _clear_pending_remove(self):
+        """Disarm a pending removal and restore the button label."""
+        if self._pending_remove_job:
+            self.dialog.after_cancel(self._pending_remove_job)
+            self._pending_remove_job = None
+        if self._pending_remove is not None:
+            self._pending_remove = None
+            if self.dialog.winfo_exists():
+                self.remove_btn.configure(text="Remove Selected")
 
 
 class FilterKeywordsDialog:
@@ -183,7 +252,7 @@ class FilterKeywordsDialog:
         self.dialog.grab_set()
         self.dialog.configure(bg=DARK_THEME["bg"])
 
-        frame = ttk.Frame(self.dialog, padding=10)
+        frame = ttk.Frame(self.dialog, style="Dialog.TFrame")
         frame.pack(fill=tk.BOTH, expand=True)
 
         ttk.Label(frame, text="Custom keywords to flag as sensationalist:").pack(anchor=tk.W)
@@ -225,21 +294,46 @@ class FilterKeywordsDialog:
         ttk.Button(btn_frame, text="Remove Selected", command=self._remove).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Close", command=self.dialog.destroy).pack(side=tk.RIGHT, padx=5)
 
+        self._known_ids = set()  # iids currently shown in the tree
+        self._existing_keywords = set()  # lowercased, as storage saves them
+        self._refresh_pending = None
         self._refresh()
         self.dialog.wait_window()
 
     def _refresh(self):
-        """Refresh the keywords list."""
-        self.tree.delete(*self.tree.get_children())
-        for kw in self.storage.get_filter_keywords(active_only=False):
-            self.tree.insert("", tk.END, iid=str(kw["id"]),
-                             values=(kw["keyword"], kw["weight"]))
+        """Refresh the keywords list, only touching rows that were added or removed."""
+        keywords = {str(kw["id"]): kw for kw in self.storage.get_filter_keywords(active_only=False)}
+        # ttk already defers redraw to idle, so one delete call per refresh
+        # is all the batching the tree needs
+        removed = self._known_ids - keywords.keys()
+        if removed:
+            self.tree.delete(*removed)
+        insert = self.tree.insert
+        for iid, kw in keywords.items():
+            if iid not in self._known_ids:
+                insert("", tk.END, iid=iid, values=(kw["keyword"], kw["weight"]))
+        self._known_ids = set(keywords)
+        self._existing_keywords = {kw["keyword"].lower() for kw in keywords.values()}
+
+    def _schedule_refresh(self):
+        """Coalesce refreshes requested in quick succession into one."""
+        if self._refresh_pending:
+            self.dialog.after_cancel(self._refresh_pending)
+        self._refresh_pending = self.dialog.after(30, self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_pending = None
+        if self.dialog.winfo_exists():
+            self._refresh()
 
     def _add(self):
         """Add a new keyword."""
         keyword = self.keyword_var.get().strip()
         if not keyword:
             return
+        # Duplicates would just fail the UNIQUE constraint; skip the round-trip
+        if keyword.lower() in self._existing_keywords:
+            return
 
         try:
             weight = int(self.weight_var.get())
@@ -249,17 +343,20 @@ class FilterKeywordsDialog:
         result = self.storage.add_filter_keyword(keyword, weight)
         if result:
             self.changed = True
+            self._existing_keywords.add(keyword.lower())
             self.keyword_var.set("")
-            self._refresh()
+            self._schedule_refresh()
 
     def _remove(self):
         """Remove selected keyword."""
         selection = self.tree.selection()
         if selection:
             keyword_id = int(selection[0])
+            self._existing_keywords.discard(self.tree.set(selection[0], "keyword").lower())
             self.storage.remove_filter_keyword(keyword_id)
             self.changed = True
-            self._refresh()
+            self.tree.delete(selection[0])
+            self._known_ids.discard(selection[0])
 
 
 class CredibilityDetailDialog:
@@ -293,12 +390,11 @@ class CredibilityDetailDialog:
 
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Credibility Analysis")
-        self.dialog.geometry("480x780")
+        self.dialog.geometry(f"480x780+{parent.winfo_x() + 200}+{parent.winfo_y() + 60}")
         self.dialog.resizable(False, False)
         self.dialog.transient(parent)
         self.dialog.grab_set()
         self.dialog.configure(bg=DARK_THEME["bg"])
-        self.dialog.geometry(f"+{parent.winfo_x() + 200}+{parent.winfo_y() + 60}")
         self.dialog.bind("<Escape>", lambda e: self.dialog.destroy())
 
         self._build_header()
@@ -802,12 +898,11 @@ class AboutDialog:
     def __init__(self, parent):
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("About WIREFEEDR")
-        self.dialog.geometry("420x380")
+        self.dialog.geometry(f"420x380+{parent.winfo_x() + 200}+{parent.winfo_y() + 100}")
         self.dialog.resizable(False, False)
         self.dialog.transient(parent)
         self.dialog.grab_set()
         self.dialog.configure(bg=DARK_THEME["bg"])
-        self.dialog.geometry(f"+{parent.winfo_x() + 200}+{parent.winfo_y() + 100}")
         self.dialog.bind("<Escape>", lambda e: self.dialog.destroy())
 
         self._build_header()
@@ -907,40 +1002,96 @@ class AboutDialog:
 
 def signal_existing_instance_to_close():
     """Try to signal any existing instance to close."""
+    # Networking modules are only needed for the single-instance handshake
+    import errno
+    import select
+    import socket
+
+    # connect_ex() results meaning "still connecting" (WSAEWOULDBLOCK on Windows)
+    connect_pending = {errno.EINPROGRESS, errno.EWOULDBLOCK, 10035}
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(1)
-        sock.connect(('127.0.0.1', SINGLE_INSTANCE_PORT))
-        sock.send(b'CLOSE')
-        sock.close()
-        import time
-        time.sleep(0.5)  # Give existing instance time to close
-    except (ConnectionRefusedError, socket.timeout, OSError):
-        pass  # No existing instance
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            # Probe without blocking: a refused loopback connect can take a
+            # second or more on Windows, but a live instance answers at once
+            sock.setblocking(False)
+            err = sock.connect_ex(('127.0.0.1', SINGLE_INSTANCE_PORT))
+            if err in connect_pending:
+                # Windows reports a failed connect as exceptional, not writable
+                _, writable, failed = select.select([], [sock], [sock], 0.1)
+                if not writable or failed:
+                    return
+                err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+            if err:
+                return  # No existing instance
+            sock.settimeout(1)
+            sock.sendall(b'CLOSE')
+            sock.shutdown(socket.SHUT_WR)
+            # The old instance replies (or just disconnects) once its window is gone
+            sock.settimeout(2)
+            sock.recv(16)
+    except OSError:
+        pass  # No existing instance, or it went away mid-handshake
 
 
 def start_instance_listener(root):
     """Start a listener thread that closes the app when signaled."""
+    import selectors
+    import socket
+
+    # Local socket pair used to wake the listener when the app closes, so the
+    # thread can block in select() instead of polling. A pipe won't do here:
+    # select() on Windows only accepts sockets.
+    wake_recv, wake_send = socket.socketpair()
+
     def listener():
+        sel = selectors.DefaultSelector()
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
-            server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             server.bind(('127.0.0.1', SINGLE_INSTANCE_PORT))
             server.listen(1)
-            server.settimeout(1)
+            sel.register(server, selectors.EVENT_READ)
+            sel.register(wake_recv, selectors.EVENT_READ)
             while True:
-                try:
+                for key, _ in sel.select():
+                    if key.fileobj is wake_recv:
+                        return  # App is shutting down
                     conn, addr = server.accept()
-                    data = conn.recv(1024)
-                    conn.close()
+                    conn.settimeout(1)
+                    try:
+                        data = conn.recv(1024)
+                    except socket.timeout:
+                        data = b''
                     if data == b'CLOSE':
-                        root.after(0, root.destroy)
-                        break
-                except socket.timeout:
-                    if not root.winfo_exists():
-                        break
+                        root.after(0, lambda: close_and_ack(conn))
+                        return
+                    conn.close()
         except OSError:
             pass  # Port in use or other error
+        finally:
+            sel.close()
+            server.close()
+            wake_recv.close()
 
+    def close_and_ack(conn):
+        """Close the app, then tell the signalling instance it can proceed."""
+        try:
+            root.destroy()
+        finally:
+            try:
+                conn.sendall(b'OK')
+            except OSError:
+                pass
+            conn.close()
+
+    def on_destroy(event):
+        if event.widget is root:
+            try:
+                wake_send.send(b'\0')
+            except OSError:
+                pass
+            wake_send.close()
+
+    root.bind("<Destroy>", on_destroy, add="+")
     thread = threading.Thread(target=listener, daemon=True)
     thread.start()
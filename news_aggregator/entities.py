@@ -1,7 +1,7 @@
 # entities.py - Entity name databases for semantic highlighting (pure data, no logic)
 
 # Titles & Roles (comprehensive - will be followed by a name)
-TITLES = {
+TITLES = frozenset({
     # === POLITICAL LEADERS ===
     "president", "vice president", "president-elect",
     "prime minister", "premier", "deputy prime minister",
@@ -73,10 +73,10 @@ TITLES = {
     "spokesperson", "spokesman", "spokeswoman", "representative",
     "coordinator", "advisor", "adviser", "counsel", "aide",
     "official", "executive", "administrator", "commissioner",
-}
+})
 
 # Heads of State & Notable Leaders (current + recent, with name variants)
-KNOWN_PEOPLE = {
+KNOWN_PEOPLE = frozenset({
     # === UNITED STATES - PRESIDENTS (All 46) ===
     "biden", "joe biden", "joseph biden", "president biden", "joseph r biden",
     "trump", "donald trump", "president trump", "donald j trump",
@@ -682,10 +682,10 @@ KNOWN_PEOPLE = {
     "sukarno", "suharto",
     "nasser", "gamal abdel nasser",
     "sadat", "anwar sadat",
-}
+})
 
 # Countries & Nations (all 195 UN members + common aliases + territories)
-COUNTRIES = {
+COUNTRIES = frozenset({
     # North America
     "united states", "america", "usa", "u.s.", "canada", "mexico",
     # Central America
@@ -749,10 +749,10 @@ COUNTRIES = {
     "nauru", "tuvalu",
     # Historical
     "soviet union", "ussr", "yugoslavia", "czechoslovakia",
-}
+})
 
 # Government & Politics (comprehensive)
-GOVERNMENT_TERMS = {
+GOVERNMENT_TERMS = frozenset({
     # === US GOVERNMENT ===
     # Executive
     "white house", "oval office", "executive branch",
@@ -842,10 +842,10 @@ GOVERNMENT_TERMS = {
     "constitutional court", "high court", "appeals court",
     "prosecutor", "attorney general", "solicitor general",
     "bureau of meteorology", "weather service",
-}
+})
 
 # Military & Defense (comprehensive)
-MILITARY_TERMS = {
+MILITARY_TERMS = frozenset({
     # === ALLIANCES & COALITIONS ===
     "nato", "north atlantic treaty organization",
     "five eyes", "aukus", "quad", "csto", "sco", "shanghai cooperation",
@@ -909,10 +909,10 @@ MILITARY_TERMS = {
     "tanks", "armored vehicles", "warships", "submarines",
     "aircraft carrier", "destroyer", "frigate", "cruiser",
     "nuclear weapons", "icbm", "ballistic missiles",
-}
+})
 
 # Organizations (Companies, NGOs, Institutions - comprehensive)
-ORGANIZATIONS = {
+ORGANIZATIONS = frozenset({
     # === INTERNATIONAL ORGANIZATIONS ===
     "united nations", "un", "who", "unesco", "unicef", "imf", "world bank",
     "world health organization", "world trade organization", "wto",
@@ -1113,10 +1113,10 @@ ORGANIZATIONS = {
     "nfl", "nba", "mlb", "nhl", "mls", "pga", "ufc", "wwe",
     "fifa", "uefa", "premier league", "la liga", "bundesliga", "serie a",
     "ioc", "olympic committee", "world athletics", "itf", "atp", "wta",
-}
+})
 
 # Places & Landmarks (comprehensive)
-PLACES = {
+PLACES = frozenset({
     # === US CITIES (Top 100+) ===
     "new york", "new york city", "nyc", "manhattan", "brooklyn", "queens", "bronx",
     "los angeles", "chicago", "houston", "phoenix", "philadelphia",
@@ -1237,10 +1237,10 @@ PLACES = {
     "gulf of mexico", "gulf of aden", "taiwan strait",
     "strait of hormuz", "strait of malacca", "english channel",
     "suez canal", "panama canal", "bosphorus",
-}
+})
 
 # Events & Conflicts (comprehensive)
-EVENTS = {
+EVENTS = frozenset({
     # === WORLD WARS ===
     "world war", "world war i", "world war ii", "wwi", "wwii",
     "first world war", "second world war", "great war",
@@ -1327,4 +1327,4 @@ EVENTS = {
     "wimbledon", "us open", "french open", "australian open",
     "tour de france", "formula 1", "f1", "grand prix",
     "commonwealth games", "asian games", "pan american games",
-}
+})
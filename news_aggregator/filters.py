@@ -26,6 +26,9 @@ STOP_WORDS = {
     "news", "report", "reports", "update", "latest", "breaking"
 }
 
+# Title words considered as clustering keywords
+_KEYWORD_WORD_RE = re.compile(r'\b[a-z]{3,}\b')
+
 
 class FilterEngine:
     def __init__(self, custom_keywords: list = None):
@@ -393,7 +396,7 @@ class FilterEngine:
     def _extract_keywords(self, text: str) -> set:
         """Extract significant keywords from text, removing stop words."""
         # Lowercase and extract words
-        words = re.findall(r'\b[a-z]{3,}\b', text.lower())
+        words = _KEYWORD_WORD_RE.findall(text.lower())
         # Filter stop words
         keywords = {w for w in words if w not in STOP_WORDS}
         # Also add bigrams (consecutive word pairs) for better matching
@@ -407,7 +410,8 @@ class FilterEngine:
         if not keywords1 or not keywords2:
             return 0.0
         intersection = len(keywords1 & keywords2)
-        union = len(keywords1 | keywords2)
+        # |A u B| = |A| + |B| - |A n B|, without building the union set
+        union = len(keywords1) + len(keywords2) - intersection
         return intersection / union if union > 0 else 0.0
 
     def cluster_articles(self, articles: List[dict], similarity_threshold: float = 0.06) -> List[dict]:
@@ -428,41 +432,52 @@ class FilterEngine:
         if not articles:
             return []
 
-        # Extract keywords for each article
-        article_keywords = []
-        for article in articles:
-            keywords = self._extract_keywords(article.get("title", ""))
-            article_keywords.append({
-                "article": article,
-                "keywords": keywords,
-                "cluster_id": None
-            })
+        # Extract keywords for each article (once; reused for the topic labels)
+        article_keywords = [
+            (article, self._extract_keywords(article.get("title", "")))
+            for article in articles
+        ]
 
         # Greedy clustering: assign each article to existing cluster or create new one
         clusters = []
+        # keyword -> indexes of clusters containing it; a cluster sharing no
+        # keyword has similarity 0 and can never win, so only these are scored
+        clusters_by_keyword = defaultdict(set)
+        similarity = self._calculate_similarity
 
-        for item in article_keywords:
+        for article, keywords in article_keywords:
             best_cluster = None
             best_similarity = 0
 
-            # Find best matching existing cluster
-            for cluster in clusters:
+            candidates = set()
+            for kw in keywords:
+                candidates.update(clusters_by_keyword.get(kw, ()))
+
+            # Find best matching existing cluster, earliest first on ties
+            for index in sorted(candidates):
+                cluster = clusters[index]
                 # Compare against cluster's combined keywords
-                similarity = self._calculate_similarity(item["keywords"], cluster["keywords"])
-                if similarity > best_similarity and similarity >= similarity_threshold:
-                    best_similarity = similarity
-                    best_cluster = cluster
+                score = similarity(keywords, cluster["keywords"])
+                if score > best_similarity and score >= similarity_threshold:
+                    best_similarity = score
+                    best_cluster = index
 
-            if best_cluster:
+            if best_cluster is not None:
                 # Add to existing cluster
-                best_cluster["articles"].append(item["article"])
-                best_cluster["keywords"] |= item["keywords"]  # Expand cluster keywords
+                cluster = clusters[best_cluster]
+                cluster["articles"].append(article)
+                cluster["article_keywords"].append(keywords)
+                cluster["keywords"] |= keywords  # Expand cluster keywords
             else:
                 # Create new cluster
+                best_cluster = len(clusters)
                 clusters.append({
-                    "articles": [item["article"]],
-                    "keywords": item["keywords"].copy()
+                    "articles": [article],
+                    "article_keywords": [keywords],
+                    "keywords": keywords.copy()
                 })
+            for kw in keywords:
+                clusters_by_keyword[kw].add(best_cluster)
 
         # Finalize clusters: pick representative, generate label
         result = []
@@ -476,8 +491,8 @@ class FilterEngine:
 
             # Get top 3 most common keywords for label
             all_keywords = []
-            for article in cluster["articles"]:
-                all_keywords.extend(self._extract_keywords(article.get("title", "")))
+            for keywords in cluster["article_keywords"]:
+                all_keywords.extend(keywords)
 
             # Count keyword frequency
             keyword_counts = defaultdict(int)
@@ -1,17 +1,470 @@
 # highlighting.py - Semantic text highlighting and entity detection
 
+import bisect
+import functools
 import re
+import urllib.parse
 import webbrowser
 
 from config import DARK_THEME
 from entities import TITLES, KNOWN_PEOPLE, ORGANIZATIONS, COUNTRIES, PLACES, EVENTS, GOVERNMENT_TERMS, MILITARY_TERMS
 
 
+# News action verbs, categorized with distinct colors
+VERB_CATEGORIES = {
+    "verb_communication": frozenset({
+        "said", "says", "saying", "stated", "states", "stating", "declared", "declares",
+        "announced", "announces", "announcing", "told", "tells", "telling", "claimed", "claims", "claiming",
+        "asserted", "asserts", "asserting", "remarked", "remarking", "commented", "comments", "commenting",
+        "mentioned", "mentioning", "expressed", "expressing", "articulated", "articulating",
+        "conveyed", "conveying", "communicated", "communicating", "spoke", "speaks", "speaking",
+        "responded", "responds", "responding", "replied", "replies", "replying",
+        "answered", "answers", "answering", "questioned", "questions", "questioning",
+        "asked", "asks", "asking", "inquired", "inquiring", "queried", "querying",
+        "interviewed", "interviewing", "briefed", "briefing", "addressed", "addressing",
+        "emphasized", "emphasised", "emphasizing", "emphasising", "stressed", "stressing",
+        "highlighted", "highlighting", "underscored", "underscoring", "reiterated", "reiterating",
+        "repeated", "repeating", "clarified", "clarifying", "explained", "explains", "explaining",
+        "elaborated", "elaborating", "detailed", "detailing", "outlined", "outlining",
+        "summarized", "summarised", "summarizing", "summarising", "recapped", "recapping",
+        "described", "describes", "describing", "depicted", "depicting",
+        "characterized", "characterised", "characterizing", "characterising",
+        "portrayed", "portraying", "presented", "presents", "presenting",
+        "relayed", "relaying", "transmitted", "transmitting", "broadcast", "broadcasts", "broadcasting",
+        "published", "publishes", "publishing", "posted", "posts", "posting",
+        "tweeted", "tweets", "tweeting", "shared", "shares", "sharing",
+        "reported", "reports", "reporting", "disclosed", "discloses", "disclosing",
+        "revealed", "reveals", "revealing", "exposed", "exposes", "exposing",
+        "leaked", "leaks", "leaking", "divulged", "divulging", "confirmed", "confirms", "confirming",
+        "acknowledged", "acknowledges", "acknowledging", "admitted", "admits", "admitting",
+        "conceded", "concedes", "conceding", "noted", "notes", "noting",
+        "added", "adds", "adding", "cited", "cites", "citing", "quoted", "quotes", "quoting",
+        "referenced", "referencing", "indicated", "indicates", "indicating",
+        "signaled", "signalled", "signals", "signaling", "signalling",
+        "suggested", "suggests", "suggesting", "implied", "implies", "implying",
+        "hinted", "hints", "hinting", "alluded", "alluding", "insinuated", "insinuating",
+        "speculated", "speculates", "speculating", "predicted", "predicts", "predicting",
+        "forecast", "forecasts", "forecasting", "projected", "projects", "projecting",
+        "estimated", "estimates", "estimating", "calculated", "calculating", "assessed", "assessing",
+        "wrote", "writes", "writing", "penned", "penning", "authored", "authoring",
+    }),
+    "verb_accusation": frozenset({
+        "accused", "accuses", "accusing", "blamed", "blames", "blaming",
+        "alleged", "alleges", "alleging", "implicated", "implicating",
+        "incriminated", "incriminating", "condemned", "condemns", "condemning",
+        "denounced", "denounces", "denouncing",
+        "criticized", "criticised", "criticizes", "criticises", "criticizing", "criticising",
+        "slammed", "slams", "slamming", "blasted", "blasts", "blasting",
+        "lambasted", "lambasting", "castigated", "castigating",
+        "rebuked", "rebukes", "rebuking", "reprimanded", "reprimanding",
+        "chastised", "chastising", "scolded", "scolding", "admonished", "admonishing",
+        "faulted", "faults", "faulting", "singled", "singling",
+        "attacked", "attacking", "assailed", "assailing", "vilified", "vilifying",
+    }),
+    "verb_support": frozenset({
+        "praised", "praises", "praising", "commended", "commends", "commending",
+        "applauded", "applauds", "applauding", "hailed", "hails", "hailing",
+        "celebrated", "celebrates", "celebrating", "honored", "honoured", "honors", "honours", "honoring", "honouring",
+        "recognized", "recognised", "recognizes", "recognises", "recognizing", "recognising",
+        "endorsed", "endorses", "endorsing", "supported", "supports", "supporting",
+        "backed", "backs", "backing", "championed", "champions", "championing",
+        "advocated", "advocates", "advocating", "promoted", "promotes", "promoting",
+        "defended", "defends", "defending", "justified", "justifies", "justifying",
+        "validated", "validates", "validating", "upheld", "upholds", "upholding",
+        "embraced", "embraces", "embracing", "touted", "touts", "touting",
+    }),
+    "verb_agreement": frozenset({
+        "agreed", "agrees", "agreeing", "disagreed", "disagrees", "disagreeing",
+        "concurred", "concurs", "concurring", "disputed", "disputes", "disputing",
+        "contested", "contests", "contesting", "challenged", "challenges", "challenging",
+        "opposed", "opposes", "opposing", "objected", "objects", "objecting",
+        "protested", "protests", "protesting", "resisted", "resists", "resisting",
+        "rejected", "rejects", "rejecting", "refused", "refuses", "refusing",
+        "declined", "declines", "declining", "denied", "denies", "denying",
+        "contradicted", "contradicts", "contradicting", "countered", "counters", "countering",
+        "rebutted", "rebuts", "rebutting", "refuted", "refutes", "refuting",
+        "dismissed", "dismisses", "dismissing", "doubted", "doubts", "doubting",
+    }),
+    "verb_decision": frozenset({
+        "decided", "decides", "deciding", "determined", "determines", "determining",
+        "concluded", "concludes", "concluding", "resolved", "resolves", "resolving",
+        "ruled", "rules", "ruling", "judged", "judges", "judging", "decreed", "decreeing",
+        "ordered", "orders", "ordering", "commanded", "commands", "commanding",
+        "directed", "directs", "directing", "instructed", "instructs", "instructing",
+        "mandated", "mandates", "mandating", "required", "requires", "requiring",
+        "demanded", "demands", "demanding", "requested", "requests", "requesting",
+        "urged", "urges", "urging", "encouraged", "encourages", "encouraging",
+        "pressured", "pressures", "pressuring", "pushed", "pushes", "pushing",
+        "lobbied", "lobbies", "lobbying", "petitioned", "petitions", "petitioning",
+        "appealed", "appeals", "appealing", "sought", "seeks", "seeking",
+        "pursued", "pursues", "pursuing", "aimed", "aims", "aiming",
+        "intended", "intends", "intending", "planned", "plans", "planning",
+        "proposed", "proposes", "proposing", "recommended", "recommends", "recommending",
+        "forced", "forces", "forcing", "compelled", "compels", "compelling",
+        "labeled", "labelled", "labels", "labeling", "labelling",
+        "designated", "designates", "designating", "classified", "classifies", "classifying",
+    }),
+    "verb_political": frozenset({
+        "enacted", "enacts", "enacting", "legislated", "legislates", "legislating",
+        "passed", "passes", "passing", "vetoed", "vetoes", "vetoing",
+        "signed", "signs", "signing", "ratified", "ratifies", "ratifying",
+        "amended", "amends", "amending", "repealed", "repeals", "repealing",
+        "overturned", "overturns", "overturning", "enforced", "enforces", "enforcing",
+        "implemented", "implements", "implementing", "administered", "administers", "administering",
+        "governed", "governs", "governing", "regulated", "regulates", "regulating",
+        "deregulated", "deregulates", "deregulating", "sanctioned", "sanctions", "sanctioning",
+        "embargoed", "embargoes", "embargoing",
+        "authorized", "authorised", "authorizes", "authorises", "authorizing", "authorising",
+        "approved", "approves", "approving", "certified", "certifies", "certifying",
+        "licensed", "licenced", "licenses", "licences", "licensing", "licencing",
+        "permitted", "permits", "permitting", "banned", "bans", "banning",
+        "prohibited", "prohibits", "prohibiting", "blocked", "blocks", "blocking",
+        "suspended", "suspends", "suspending", "revoked", "revokes", "revoking",
+        "rescinded", "rescinds", "rescinding", "appointed", "appoints", "appointing",
+        "nominated", "nominates", "nominating", "elected", "elects", "electing",
+        "inaugurated", "inaugurates", "inaugurating", "sworn", "swore", "swearing",
+        "impeached", "impeaches", "impeaching", "ousted", "ousts", "ousting",
+        "toppled", "topples", "toppling", "overthrew", "overthrows", "overthrowing",
+        "resigned", "resigns", "resigning", "retired", "retires", "retiring", "quit", "quits", "quitting",
+    }),
+    "verb_military": frozenset({
+        "attacked", "attacks", "attacking", "struck", "strikes", "striking",
+        "bombed", "bombs", "bombing", "shelled", "shells", "shelling",
+        "fired", "fires", "firing", "shot", "shoots", "shooting",
+        "targeted", "targets", "targeting", "assaulted", "assaults", "assaulting",
+        "invaded", "invades", "invading", "occupied", "occupies", "occupying",
+        "seized", "seizes", "seizing", "captured", "captures", "capturing",
+        "conquered", "conquers", "conquering", "liberated", "liberates", "liberating",
+        "retreated", "retreats", "retreating", "withdrew", "withdraws", "withdrawing",
+        "deployed", "deploys", "deploying", "mobilized", "mobilised", "mobilizes", "mobilises", "mobilizing", "mobilising",
+        "escalated", "escalates", "escalating", "retaliated", "retaliates", "retaliating",
+        "fortified", "fortifies", "fortifying", "besieged", "besieges", "besieging",
+        "blockaded", "blockades", "blockading", "ambushed", "ambushes", "ambushing",
+        "raided", "raids", "raiding", "stormed", "storms", "storming",
+        "clashed", "clashes", "clashing", "fought", "fights", "fighting",
+        "battled", "battles", "battling", "killed", "kills", "killing",
+        "slew", "slays", "slaying", "murdered", "murders", "murdering",
+        "assassinated", "assassinates", "assassinating", "executed", "executes", "executing",
+        "massacred", "massacres", "massacring", "slaughtered", "slaughters", "slaughtering",
+        "wounded", "wounds", "wounding", "injured", "injures", "injuring",
+        "maimed", "maims", "maiming", "hurt", "hurts", "hurting",
+        "died", "dies", "dying", "perished", "perishes", "perishing",
+        "surrendered", "surrenders", "surrendering", "capitulated", "capitulates", "capitulating",
+        "ceased", "ceases", "ceasing",
+    }),
+    "verb_legal": frozenset({
+        "arrested", "arrests", "arresting", "detained", "detains", "detaining",
+        "jailed", "jails", "jailing", "imprisoned", "imprisons", "imprisoning",
+        "incarcerated", "incarcerates", "incarcerating", "released", "releases", "releasing",
+        "freed", "frees", "freeing", "charged", "charges", "charging",
+        "indicted", "indicts", "indicting", "prosecuted", "prosecutes", "prosecuting",
+        "tried", "tries", "trying", "convicted", "convicts", "convicting",
+        "acquitted", "acquits", "acquitting", "sentenced", "sentences", "sentencing",
+        "fined", "fines", "fining", "pardoned", "pardons", "pardoning",
+        "exonerated", "exonerates", "exonerating", "testified", "testifies", "testifying",
+        "sued", "sues", "suing", "settled", "settles", "settling",
+        "litigated", "litigates", "litigating", "extradited", "extradites", "extraditing",
+        "deported", "deports", "deporting", "subpoenaed", "subpoenas", "subpoenaing",
+    }),
+    "verb_economic": frozenset({
+        "invested", "invests", "investing", "divested", "divests", "divesting",
+        "acquired", "acquires", "acquiring", "merged", "merges", "merging",
+        "bought", "buys", "buying", "sold", "sells", "selling",
+        "traded", "trades", "trading", "profited", "profits", "profiting",
+        "earned", "earns", "earning", "spent", "spends", "spending",
+        "paid", "pays", "paying", "funded", "funds", "funding",
+        "financed", "finances", "financing", "borrowed", "borrows", "borrowing",
+        "lent", "lends", "lending", "defaulted", "defaults", "defaulting",
+        "restructured", "restructures", "restructuring", "downsized", "downsizes", "downsizing",
+        "expanded", "expands", "expanding", "grew", "grows", "growing",
+        "shrank", "shrinks", "shrinking", "surged", "surges", "surging",
+        "plunged", "plunges", "plunging", "soared", "soars", "soaring",
+        "plummeted", "plummets", "plummeting", "rallied", "rallies", "rallying",
+        "rose", "rises", "rising", "fell", "falls", "falling",
+        "increased", "increases", "increasing", "decreased", "decreases", "decreasing",
+        "doubled", "doubles", "doubling", "tripled", "triples", "tripling",
+        "halved", "halves", "halving", "slashed", "slashes", "slashing",
+        "cut", "cuts", "cutting", "raised", "raises", "raising",
+        "boosted", "boosts", "boosting", "lifted", "lifts", "lifting",
+        "lowered", "lowers", "lowering", "hired", "hires", "hiring",
+        "billed", "bills", "billing", "cost", "costs", "costing",
+    }),
+    "verb_discovery": frozenset({
+        "discovered", "discovers", "discovering", "found", "finds", "finding",
+        "uncovered", "uncovers", "uncovering", "unearthed", "unearths", "unearthing",
+        "detected", "detects", "detecting", "identified", "identifies", "identifying",
+        "located", "locates", "locating", "traced", "traces", "tracing",
+        "tracked", "tracks", "tracking", "monitored", "monitors", "monitoring",
+        "surveyed", "surveys", "surveying", "examined", "examines", "examining",
+        "analyzed", "analysed", "analyzes", "analyses", "analyzing", "analysing",
+        "investigated", "investigates", "investigating", "probed", "probes", "probing",
+        "scrutinized", "scrutinised", "scrutinizes", "scrutinises", "scrutinizing", "scrutinising",
+        "reviewed", "reviews", "reviewing", "audited", "audits", "auditing",
+        "inspected", "inspects", "inspecting", "verified", "verifies", "verifying",
+        "tested", "tests", "testing", "searched", "searches", "searching",
+        "recovered", "recovers", "recovering", "encountered", "encounters", "encountering",
+        "proved", "proves", "proving", "proven", "conducted", "conducts", "conducting",
+    }),
+    "verb_change": frozenset({
+        "changed", "changes", "changing", "altered", "alters", "altering",
+        "modified", "modifies", "modifying", "revised", "revises", "revising",
+        "updated", "updates", "updating", "upgraded", "upgrades", "upgrading",
+        "improved", "improves", "improving", "enhanced", "enhances", "enhancing",
+        "transformed", "transforms", "transforming", "converted", "converts", "converting",
+        "shifted", "shifts", "shifting", "transitioned", "transitions", "transitioning",
+        "evolved", "evolves", "evolving", "adapted", "adapts", "adapting",
+        "adjusted", "adjusts", "adjusting", "reformed", "reforms", "reforming",
+        "restructured", "restructures", "restructuring",
+        "reorganized", "reorganised", "reorganizes", "reorganises", "reorganizing", "reorganising",
+        "overhauled", "overhauls", "overhauling", "replaced", "replaces", "replacing",
+        "substituted", "substitutes", "substituting", "swapped", "swaps", "swapping",
+        "switched", "switches", "switching", "reversed", "reverses", "reversing",
+    }),
+    "verb_creation": frozenset({
+        "created", "creates", "creating", "built", "builds", "building",
+        "constructed", "constructs", "constructing", "developed", "develops", "developing",
+        "designed", "designs", "designing", "invented", "invents", "inventing",
+        "launched", "launches", "launching", "introduced", "introduces", "introducing",
+        "unveiled", "unveils", "unveiling", "opened", "opens", "opening",
+        "established", "establishes", "establishing", "founded", "founds", "founding",
+        "started", "starts", "starting", "began", "begins", "beginning",
+        "initiated", "initiates", "initiating", "closed", "closes", "closing",
+        "shut", "shuts", "shutting", "ended", "ends", "ending",
+        "terminated", "terminates", "terminating", "demolished", "demolishes", "demolishing",
+        "destroyed", "destroys", "destroying", "ruined", "ruins", "ruining",
+        "damaged", "damages", "damaging", "wrecked", "wrecks", "wrecking",
+        "devastated", "devastates", "devastating", "razed", "razes", "razing",
+        "leveled", "levelled", "levels", "leveling", "levelling",
+        "collapsed", "collapses", "collapsing", "imploded", "implodes", "imploding",
+        "exploded", "explodes", "exploding", "detonated", "detonates", "detonating",
+        "burned", "burnt", "burns", "burning", "flooded", "floods", "flooding",
+        "sank", "sinks", "sinking",
+    }),
+    "verb_movement": frozenset({
+        "moved", "moves", "moving", "traveled", "travelled", "travels", "traveling", "travelling",
+        "went", "goes", "going", "came", "comes", "coming",
+        "arrived", "arrives", "arriving", "departed", "departs", "departing",
+        "left", "leaves", "leaving", "returned", "returns", "returning",
+        "visited", "visits", "visiting", "toured", "tours", "touring",
+        "fled", "flees", "fleeing", "escaped", "escapes", "escaping",
+        "evacuated", "evacuates", "evacuating", "migrated", "migrates", "migrating",
+        "immigrated", "immigrates", "immigrating", "emigrated", "emigrates", "emigrating",
+        "expelled", "expels", "expelling", "exiled", "exiles", "exiling",
+        "banished", "banishes", "banishing", "crossed", "crosses", "crossing",
+        "entered", "enters", "entering", "exited", "exits", "exiting",
+        "landed", "lands", "landing", "crashed", "crashes", "crashing",
+        "collided", "collides", "colliding", "derailed", "derails", "derailing",
+        "capsized", "capsizes", "capsizing", "embarked", "embarks", "embarking",
+    }),
+    "verb_emotion": frozenset({
+        "feared", "fears", "fearing", "worried", "worries", "worrying",
+        "concerned", "concerns", "concerning", "alarmed", "alarms", "alarming",
+        "shocked", "shocks", "shocking", "surprised", "surprises", "surprising",
+        "stunned", "stuns", "stunning", "outraged", "outrages", "outraging",
+        "angered", "angers", "angering", "infuriated", "infuriates", "infuriating",
+        "pleased", "pleases", "pleasing", "delighted", "delights", "delighting",
+        "thrilled", "thrills", "thrilling", "excited", "excites", "exciting",
+        "relieved", "relieves", "relieving", "disappointed", "disappoints", "disappointing",
+        "frustrated", "frustrates", "frustrating", "dismayed", "dismays", "dismaying",
+        "mourned", "mourns", "mourning", "grieved", "grieves", "grieving",
+        "lamented", "laments", "lamenting", "cheered", "cheers", "cheering",
+        "welcomed", "welcomes", "welcoming",
+    }),
+    "verb_prevention": frozenset({
+        "prevented", "prevents", "preventing", "stopped", "stops", "stopping",
+        "halted", "halts", "halting", "barred", "bars", "barring",
+        "thwarted", "thwarts", "thwarting", "foiled", "foils", "foiling",
+        "averted", "averts", "averting", "avoided", "avoids", "avoiding",
+        "protected", "protects", "protecting", "shielded", "shields", "shielding",
+        "guarded", "guards", "guarding", "secured", "secures", "securing",
+        "safeguarded", "safeguards", "safeguarding", "preserved", "preserves", "preserving",
+        "saved", "saves", "saving", "rescued", "rescues", "rescuing",
+    }),
+    "verb_competition": frozenset({
+        "won", "wins", "winning", "lost", "loses", "losing",
+        "defeated", "defeats", "defeating", "beat", "beats", "beating",
+        "prevailed", "prevails", "prevailing", "triumphed", "triumphs", "triumphing",
+        "succeeded", "succeeds", "succeeding", "failed", "fails", "failing",
+        "achieved", "achieves", "achieving", "accomplished", "accomplishes", "accomplishing",
+        "completed", "completes", "completing", "finished", "finishes", "finishing",
+        "led", "leads", "leading", "trailed", "trails", "trailing",
+        "tied", "ties", "tying", "drew", "draws", "drawing",
+        "qualified", "qualifies", "qualifying", "eliminated", "eliminates", "eliminating",
+        "advanced", "advances", "advancing", "competed", "competes", "competing",
+    }),
+    "verb_medical": frozenset({
+        "diagnosed", "diagnoses", "diagnosing", "treated", "treats", "treating",
+        "cured", "cures", "curing", "healed", "heals", "healing",
+        "hospitalized", "hospitalised", "hospitalizes", "hospitalises", "hospitalizing", "hospitalising",
+        "operated", "operates", "operating", "vaccinated", "vaccinates", "vaccinating",
+        "infected", "infects", "infecting", "contracted", "contracts", "contracting",
+        "spread", "spreads", "spreading", "transmitted", "transmits", "transmitting",
+        "quarantined", "quarantines", "quarantining", "isolated", "isolates", "isolating",
+        "sickened", "sickens", "sickening", "suffered", "suffers", "suffering",
+    }),
+}
+
+def _compile_all(patterns):
+    return [re.compile(p, re.IGNORECASE) for p in patterns]
+
+
+# Number patterns, compiled once.  Within each group earlier patterns claim
+# overlapping text first.  Statistics and catch-all number patterns all need
+# a digit, so they are skipped for text without any.
+_MONEY_PATTERNS = _compile_all([
+    r'\$[\d,]+(?:\.\d+)?(?:\s*(?:million|billion|trillion))?',
+    r'\u20ac[\d,]+(?:\.\d+)?(?:\s*(?:million|billion|trillion))?',
+    r'\u00a3[\d,]+(?:\.\d+)?(?:\s*(?:million|billion|trillion))?',
+    r'\b\d+(?:\.\d+)?\s*(?:dollars|euros|pounds|yen|yuan)',
+])
+
+_STATS_PATTERNS = _compile_all([
+    r'\b\d+(?:\.\d+)?%',
+    r'\b\d+(?:\.\d+)?\s*(?:percent|percentage)',
+    r'\b\d{1,3}(?:,\d{3})+\b',
+    r'\b\d+(?:\.\d+)?\s*(?:million|billion|trillion|thousand)\b',
+    r'\b\d+\s*(?:people|troops|soldiers|casualties|deaths|injured|killed|wounded)',
+])
+
+_DATE_PATTERNS = _compile_all([
+    r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(?:st|nd|rd|th)?(?:,?\s+\d{4})?',
+    r'\b\d{1,2}(?:st|nd|rd|th)?\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)(?:,?\s+\d{4})?',
+    r'\b(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)',
+    r'\b(?:last|next|this)\s+(?:week|month|year|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)',
+])
+
+_NUMBER_PATTERNS = _compile_all([
+    # Ordinals
+    r'\b\d+(?:st|nd|rd|th)\b',              # 1st, 2nd, 3rd, 250th
+    # Times
+    r'\b\d{1,2}:\d{2}(?::\d{2})?\s*(?:AM|PM|am|pm|a\.m\.|p\.m\.)?\b',  # 3:00, 10:30 PM
+    # Ranges and scores
+    r'\b\d+(?:\.\d+)?[-\u2013\u2014]\d+(?:\.\d+)?\b', # 10-15, 2.5-3.0, 2020-2024
+    r'\b\d+/\d+\b',                         # Fractions/scores: 1/2, 3/4
+    # Decades
+    r"\b\d{2,4}'?s\b",                      # 1990s, 80s, '90s
+    # With units
+    r'\b\d+(?:\.\d+)?\s*(?:km|mi|m|ft|in|cm|mm|kg|lb|lbs|oz|g|mg|mph|kph|fps|hz|khz|mhz|ghz|kb|mb|gb|tb|kw|mw|gw)\b',
+    # With K/M/B abbreviations
+    r'\b\d+(?:\.\d+)?\s*[KkMmBb]\b',        # 5K, 10M, 2.5B
+    # Version numbers
+    r'\bv?\d+(?:\.\d+)+\b',                 # v1.0, 2.5.1, v10.3.2
+    # Scientific notation
+    r'\b\d+(?:\.\d+)?[eE][+-]?\d+\b',       # 1e10, 2.5e-3
+    # Temperatures
+    r'[-\u2212]?\d+(?:\.\d+)?\u00b0[FCfc]?\b',        # 72 deg F, -10 deg C, 22 deg
+    # Coordinates
+    r'\b\d+(?:\.\d+)?\u00b0[NSEW]?\b',           # 40.7128 deg N
+    # Stock/number changes
+    r'[+\u2212-]\d+(?:\.\d+)?%?\b',              # +5.2, -3.8, +12%
+    # Numbered items
+    r'(?:No\.|#|\u2116)\s*\d+\b',                # No. 1, #1, No.1
+    # Hyphenated number phrases
+    r'\b\d+[-\u2013](?:year|day|hour|minute|month|week|meter|mile|foot|pound|dollar|point|game|run|set)\b',
+    # Approximate/comparative
+    r'[~\u2248<>\u2264\u2265]\s*\d+(?:\.\d+)?',            # ~100, >50, <100
+    # Feet and inches
+    r"\b\d+['\u2032]\s*\d*[\"\u2033]?\b",            # 6'2", 5'
+    # Plain numbers (catch-all, must be last)
+    r'\b\d+(?:\.\d+)?\b',                   # 42, 3.14
+])
+
+# Roman numerals (common ones in news) --- letters only, never overlap a digit match
+_ROMAN_NUMERAL_PATTERN = re.compile(
+    r'\b(?:III|II|IV|VI|VII|VIII|IX|XI|XII|XIII|XIV|XV|XVI|XVII|XVIII|XIX|XX|XXI)\b',
+    re.IGNORECASE,
+)
+
+_DIGIT_PATTERN = re.compile(r'\d')
+
+# Verb -> category lookup; every verb is a single word, so one pass over the
+# word tokens with a dict probe finds them all.  setdefault keeps the first
+# category for verbs listed more than once.
+_VERB_LOOKUP = {}
+for _category, _verbs in VERB_CATEGORIES.items():
+    for _verb in _verbs:
+        _VERB_LOOKUP.setdefault(_verb, _category)
+del _category, _verbs, _verb
+
+_WORD_PATTERN = re.compile(r'\b[A-Za-z]+\b')
+
+_NEWLINE_PATTERN = re.compile(r'\n')
+
+_SENTENCE_END_PATTERN = re.compile(r'[.!?] ')
+
+# Title followed by one or two capitalized name words, e.g. "president Xi Jinping".
+# One alternation scans the text once; longest titles first so "prime minister"
+# wins over "minister" at the same position.
+_TITLE_PATTERN = re.compile(
+    r'\b((?:' + '|'.join(re.escape(title) for title in sorted(TITLES, key=lambda t: (-len(t), t)))
+    + r')\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)',
+    re.IGNORECASE,
+)
+
+# Capitalized word sequences, e.g. "Zhang Youxia", "Central Military Commission".
+# Trailing whitespace belongs to the optional glue word, so a whitespace run can
+# only be split one way and the scan never backtracks over it.
+_CAP_SEQUENCE_PATTERN = re.compile(
+    r"([A-Z][a-z]+(?:[-'][a-z]+)?(?:\s+(?:(?:of|the|and|for|de|von|van)\s*)?[A-Z][a-z]+(?:[-'][a-z]+)?)*)"
+)
+
+# Known entity phrase -> category, one probe instead of one per database.
+# Databases are listed in priority order; a phrase in several takes the first.
+_ENTITY_LOOKUP = {}
+for _category, _names in (
+    ("people", KNOWN_PEOPLE),
+    ("events", EVENTS),
+    ("military", MILITARY_TERMS),
+    ("government", GOVERNMENT_TERMS),
+    ("organizations", ORGANIZATIONS),
+    ("countries", COUNTRIES),
+    ("places", PLACES),
+):
+    for _name in _names:
+        _ENTITY_LOOKUP.setdefault(_name, _category)
+del _category, _names, _name
+
+# Single words still highlighted when they open a sentence
+_SENTENCE_START_ENTITIES = COUNTRIES | PLACES | ORGANIZATIONS
+
+# Keywords that mark a capitalized phrase as an institution.  Groups are in
+# priority order: a phrase with keywords from several groups takes the first.
+_PHRASE_KEYWORD_GROUPS = (
+    ("government", ("commission", "committee", "council", "ministry",
+                    "department", "bureau", "agency", "authority",
+                    "administration", "board", "corps", "command")),
+    ("military", ("army", "navy", "force", "forces", "guard", "corps",
+                  "fleet", "brigade", "division", "regiment")),
+    ("organizations", ("university", "college", "institute", "corporation",
+                       "company", "inc", "corp", "foundation", "association",
+                       "bank", "group", "trust")),
+)
+
+# keyword -> (priority, category)
+_PHRASE_KEYWORDS = {}
+for _rank, (_category, _keywords) in enumerate(_PHRASE_KEYWORD_GROUPS):
+    for _keyword in _keywords:
+        _PHRASE_KEYWORDS.setdefault(_keyword, (_rank, _category))
+del _rank, _category, _keywords, _keyword
+
+# Words to skip in capitalized sequences (sentence starters, common words)
+_SKIP_WORDS = frozenset({
+    "the", "a", "an", "this", "that", "these", "those", "it", "its",
+    "has", "have", "had", "been", "was", "were", "are", "is", "be",
+    "said", "says", "told", "added", "noted", "asked", "called",
+    "new", "many", "more", "most", "some", "all", "other", "such",
+    "also", "just", "even", "still", "well", "back", "now", "then",
+    "but", "and", "for", "not", "you", "his", "her", "their", "our",
+    "first", "last", "next", "high", "low", "long", "short", "big",
+    "according", "including", "during", "after", "before", "since",
+    "while", "where", "when", "which", "what", "who", "how", "why",
+    "continue", "reading", "here", "there", "very", "much", "far",
+    "however", "although", "though", "because", "therefore", "thus",
+})
+
+
 def setup_highlight_tags(app):
     """Configure text tags for semantic highlighting."""
-    # Bold for first sentence (lede)
-    # lede tag removed --- no special formatting for first sentence
-
     # Entity categories (clickable Wikipedia links) --- bright for dark bg
     app.highlight_categories = {
         "people": "#00e5e5",      # Bright Cyan
@@ -77,7 +530,7 @@ def setup_highlight_tags(app):
     # Store related article targets (populated in _finish_typewriter)
     app._related_article_targets = {}
 
-    # Store wiki link targets: {(start, end): (search_term, category)}
+    # Store wiki link targets: {start: (end, search_term, category)}
     app.wiki_link_targets = {}
 
     # Initialize entity databases
@@ -94,26 +547,113 @@ def init_entity_databases(app):
     app.organizations = ORGANIZATIONS
     app.places = PLACES
     app.events = EVENTS
+    compute_highlights.cache_clear()
 
 
 def apply_highlighting(app, text_widget, text):
     """Apply semantic highlighting to text in the widget."""
 
-    # Clear previous wiki link targets
-    app.wiki_link_targets = {}
-
     # Insert text first
     text_widget.insert("1.0", text)
 
-    # Bold the first sentence (lede)
-    first_sentence_end = None
-    for i, char in enumerate(text):
-        if char in ".!?" and i > 20:
-            first_sentence_end = i + 1
-            break
-    # lede highlighting removed
-
-    text_lower = text.lower()
+    spans = compute_highlights(text)
+    for tag, ranges in _group_ranges(spans, _offset_indexer(text)).items():
+        text_widget.tag_add(tag, *ranges)
+    app.wiki_link_targets = _link_targets(app, spans)
+
+
+def append_highlighting(app, text_widget, text, new_text):
+    """Append new_text after text (already in the widget) and retag only what changed."""
+    text_widget.insert("end-1c", new_text)
+
+    # Appending can only extend or reclassify highlights near the old end, so
+    # keep the spans before a settled sentence boundary and recompute just the
+    # tail. Partial texts bypass the span cache so they don't evict full
+    # articles kept for revisits; the previous tick's spans are carried on app
+    full_text = text + new_text
+    old_spans = app._typewriter_spans if text else ()
+    tail_start = _settled_boundary(text, old_spans)
+    spans = tuple(span for span in old_spans if span[1] <= tail_start)
+    if tail_start:
+        spans += tuple((start + tail_start, end + tail_start, tag, search_term)
+                       for start, end, tag, search_term
+                       in compute_highlights.__wrapped__(full_text[tail_start:]))
+    else:
+        spans += compute_highlights.__wrapped__(full_text)
+    app._typewriter_spans = spans
+
+    old_set = set(old_spans)
+    to_index = _offset_indexer(full_text)
+    added = [span for span in spans if span not in old_set]
+    # Highlights never overlap, so clearing a removed span can't touch a kept one
+    for start, end, tag, _ in old_set.difference(spans):
+        text_widget.tag_remove(tag, to_index(start), to_index(end))
+    for tag, ranges in _group_ranges(added, to_index).items():
+        text_widget.tag_add(tag, *ranges)
+    app.wiki_link_targets = _link_targets(app, spans)
+
+
+# Characters kept before the end of the typed text when picking the boundary
+# append_highlighting recomputes from; no highlight pattern reaches this far
+_SETTLED_MARGIN = 300
+
+
+def _settled_boundary(text, spans):
+    """Offset of a sentence start that text appended later can't affect, or 0.
+
+    The boundary sits at least _SETTLED_MARGIN characters before the end of
+    text and inside no existing span, so highlights on either side of it are
+    computed the same whether or not the text before it is included.
+    """
+    limit = len(text) - _SETTLED_MARGIN
+    while limit > 0:
+        pos = max(text.rfind(". ", 0, limit), text.rfind("! ", 0, limit),
+                  text.rfind("? ", 0, limit))
+        if pos < 0:
+            return 0
+        boundary = pos + 2
+        if not any(start < boundary < end for start, end, _, _ in spans):
+            return boundary
+        limit = pos
+    return 0
+
+
+def _offset_indexer(text):
+    """Return a function mapping char offsets in text to Tk "line.col" indices."""
+    # Convert char offsets to "line.col" directly so Tk doesn't walk the
+    # text for every "1.0+Nc" index
+    line_starts = [0]
+    line_starts.extend(m.end() for m in _NEWLINE_PATTERN.finditer(text))
+
+    def to_index(offset):
+        line = bisect.bisect_right(line_starts, offset) - 1
+        return f"{line + 1}.{offset - line_starts[line]}"
+
+    return to_index
+
+
+def _group_ranges(spans, to_index):
+    """Group highlight spans per tag so each tag costs one Tcl call."""
+    tag_ranges = {}
+    for start, end, tag, _ in spans:
+        ranges = tag_ranges.setdefault(tag, [])
+        ranges.append(to_index(start))
+        ranges.append(to_index(end))
+    return tag_ranges
+
+
+def _link_targets(app, spans):
+    """Map each clickable highlight's start offset to (end, search_term, tag)."""
+    # Highlights never overlap, so each link is keyed by its start offset
+    return {start: (end, search_term, tag)
+            for start, end, tag, search_term in spans
+            if search_term and tag in app.highlight_categories}
+
+
+@functools.lru_cache(maxsize=256)
+def compute_highlights(text):
+    """Return (start, end, tag, search_term) highlight spans for text."""
+    spans = []
 
     # Track highlighted ranges to avoid overlaps
     highlighted_ranges = []
@@ -128,406 +668,64 @@ def apply_highlighting(app, text_widget, text):
         if is_overlapping(start, end):
             return False
         highlighted_ranges.append((start, end))
-        start_idx = f"1.0+{start}c"
-        end_idx = f"1.0+{end}c"
-        text_widget.tag_add(tag, start_idx, end_idx)
-        if search_term and tag in app.highlight_categories:
-            app.wiki_link_targets[(start, end)] = (search_term, tag)
+        spans.append((start, end, tag, search_term))
         return True
 
     # === NUMBERS (non-clickable) ===
 
+    has_digits = _DIGIT_PATTERN.search(text) is not None
+
     # 1. Money patterns
-    money_patterns = [
-        r'\$[\d,]+(?:\.\d+)?(?:\s*(?:million|billion|trillion))?',
-        r'\u20ac[\d,]+(?:\.\d+)?(?:\s*(?:million|billion|trillion))?',
-        r'\u00a3[\d,]+(?:\.\d+)?(?:\s*(?:million|billion|trillion))?',
-        r'\b\d+(?:\.\d+)?\s*(?:dollars|euros|pounds|yen|yuan)',
-    ]
-    for pattern in money_patterns:
-        for match in re.finditer(pattern, text, re.IGNORECASE):
+    for pattern in _MONEY_PATTERNS:
+        for match in pattern.finditer(text):
             add_highlight(match.start(), match.end(), "money")
 
     # 2. Statistics patterns
-    stats_patterns = [
-        r'\b\d+(?:\.\d+)?%',
-        r'\b\d+(?:\.\d+)?\s*(?:percent|percentage)',
-        r'\b\d{1,3}(?:,\d{3})+\b',
-        r'\b\d+(?:\.\d+)?\s*(?:million|billion|trillion|thousand)\b',
-        r'\b\d+\s*(?:people|troops|soldiers|casualties|deaths|injured|killed|wounded)',
-    ]
-    for pattern in stats_patterns:
-        for match in re.finditer(pattern, text, re.IGNORECASE):
-            add_highlight(match.start(), match.end(), "statistics")
+    if has_digits:
+        for pattern in _STATS_PATTERNS:
+            for match in pattern.finditer(text):
+                add_highlight(match.start(), match.end(), "statistics")
 
     # 3. Date patterns
-    date_patterns = [
-        r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(?:st|nd|rd|th)?(?:,?\s+\d{4})?',
-        r'\b\d{1,2}(?:st|nd|rd|th)?\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)(?:,?\s+\d{4})?',
-        r'\b(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)',
-        r'\b(?:last|next|this)\s+(?:week|month|year|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)',
-    ]
-    for pattern in date_patterns:
-        for match in re.finditer(pattern, text, re.IGNORECASE):
+    for pattern in _DATE_PATTERNS:
+        for match in pattern.finditer(text):
             add_highlight(match.start(), match.end(), "dates")
 
     # 4. Catch-all numbers (not already categorized)
-    number_patterns = [
-        # Ordinals
-        r'\b\d+(?:st|nd|rd|th)\b',              # 1st, 2nd, 3rd, 250th
-        # Times
-        r'\b\d{1,2}:\d{2}(?::\d{2})?\s*(?:AM|PM|am|pm|a\.m\.|p\.m\.)?\b',  # 3:00, 10:30 PM
-        # Ranges and scores
-        r'\b\d+(?:\.\d+)?[-\u2013\u2014]\d+(?:\.\d+)?\b', # 10-15, 2.5-3.0, 2020-2024
-        r'\b\d+/\d+\b',                         # Fractions/scores: 1/2, 3/4
-        # Decades
-        r"\b\d{2,4}'?s\b",                      # 1990s, 80s, '90s
-        # With units
-        r'\b\d+(?:\.\d+)?\s*(?:km|mi|m|ft|in|cm|mm|kg|lb|lbs|oz|g|mg|mph|kph|fps|hz|khz|mhz|ghz|kb|mb|gb|tb|kw|mw|gw)\b',
-        # With K/M/B abbreviations
-        r'\b\d+(?:\.\d+)?\s*[KkMmBb]\b',        # 5K, 10M, 2.5B
-        # Version numbers
-        r'\bv?\d+(?:\.\d+)+\b',                 # v1.0, 2.5.1, v10.3.2
-        # Scientific notation
-        r'\b\d+(?:\.\d+)?[eE][+-]?\d+\b',       # 1e10, 2.5e-3
-        # Temperatures
-        r'[-\u2212]?\d+(?:\.\d+)?\u00b0[FCfc]?\b',        # 72 deg F, -10 deg C, 22 deg
-        # Coordinates
-        r'\b\d+(?:\.\d+)?\u00b0[NSEW]?\b',           # 40.7128 deg N
-        # Stock/number changes
-        r'[+\u2212-]\d+(?:\.\d+)?%?\b',              # +5.2, -3.8, +12%
-        # Numbered items
-        r'(?:No\.|#|\u2116)\s*\d+\b',                # No. 1, #1, No.1
-        # Hyphenated number phrases
-        r'\b\d+[-\u2013](?:year|day|hour|minute|month|week|meter|mile|foot|pound|dollar|point|game|run|set)\b',
-        # Approximate/comparative
-        r'[~\u2248<>\u2264\u2265]\s*\d+(?:\.\d+)?',            # ~100, >50, <100
-        # Roman numerals (common ones in news)
-        r'\b(?:III|II|IV|VI|VII|VIII|IX|XI|XII|XIII|XIV|XV|XVI|XVII|XVIII|XIX|XX|XXI)\b',
-        # Feet and inches
-        r"\b\d+['\u2032]\s*\d*[\"\u2033]?\b",            # 6'2", 5'
-        # Plain numbers (catch-all, must be last)
-        r'\b\d+(?:\.\d+)?\b',                   # 42, 3.14
-    ]
-    for pattern in number_patterns:
-        for match in re.finditer(pattern, text, re.IGNORECASE):
-            add_highlight(match.start(), match.end(), "numbers")
+    if has_digits:
+        for pattern in _NUMBER_PATTERNS:
+            for match in pattern.finditer(text):
+                add_highlight(match.start(), match.end(), "numbers")
+    for match in _ROMAN_NUMERAL_PATTERN.finditer(text):
+        add_highlight(match.start(), match.end(), "numbers")
 
     # 5. Verbs (news action words) - categorized with distinct colors
-    verb_categories = {
-        "verb_communication": [
-            "said", "says", "saying", "stated", "states", "stating", "declared", "declares",
-            "announced", "announces", "announcing", "told", "tells", "telling", "claimed", "claims", "claiming",
-            "asserted", "asserts", "asserting", "remarked", "remarking", "commented", "comments", "commenting",
-            "mentioned", "mentioning", "expressed", "expressing", "articulated", "articulating",
-            "conveyed", "conveying", "communicated", "communicating", "spoke", "speaks", "speaking",
-            "responded", "responds", "responding", "replied", "replies", "replying",
-            "answered", "answers", "answering", "questioned", "questions", "questioning",
-            "asked", "asks", "asking", "inquired", "inquiring", "queried", "querying",
-            "interviewed", "interviewing", "briefed", "briefing", "addressed", "addressing",
-            "emphasized", "emphasised", "emphasizing", "emphasising", "stressed", "stressing",
-            "highlighted", "highlighting", "underscored", "underscoring", "reiterated", "reiterating",
-            "repeated", "repeating", "clarified", "clarifying", "explained", "explains", "explaining",
-            "elaborated", "elaborating", "detailed", "detailing", "outlined", "outlining",
-            "summarized", "summarised", "summarizing", "summarising", "recapped", "recapping",
-            "described", "describes", "describing", "depicted", "depicting",
-            "characterized", "characterised", "characterizing", "characterising",
-            "portrayed", "portraying", "presented", "presents", "presenting",
-            "relayed", "relaying", "transmitted", "transmitting", "broadcast", "broadcasts", "broadcasting",
-            "published", "publishes", "publishing", "posted", "posts", "posting",
-            "tweeted", "tweets", "tweeting", "shared", "shares", "sharing",
-            "reported", "reports", "reporting", "disclosed", "discloses", "disclosing",
-            "revealed", "reveals", "revealing", "exposed", "exposes", "exposing",
-            "leaked", "leaks", "leaking", "divulged", "divulging", "confirmed", "confirms", "confirming",
-            "acknowledged", "acknowledges", "acknowledging", "admitted", "admits", "admitting",
-            "conceded", "concedes", "conceding", "noted", "notes", "noting",
-            "added", "adds", "adding", "cited", "cites", "citing", "quoted", "quotes", "quoting",
-            "referenced", "referencing", "indicated", "indicates", "indicating",
-            "signaled", "signalled", "signals", "signaling", "signalling",
-            "suggested", "suggests", "suggesting", "implied", "implies", "implying",
-            "hinted", "hints", "hinting", "alluded", "alluding", "insinuated", "insinuating",
-            "speculated", "speculates", "speculating", "predicted", "predicts", "predicting",
-            "forecast", "forecasts", "forecasting", "projected", "projects", "projecting",
-            "estimated", "estimates", "estimating", "calculated", "calculating", "assessed", "assessing",
-            "wrote", "writes", "writing", "penned", "penning", "authored", "authoring",
-        ],
-        "verb_accusation": [
-            "accused", "accuses", "accusing", "blamed", "blames", "blaming",
-            "alleged", "alleges", "alleging", "implicated", "implicating",
-            "incriminated", "incriminating", "condemned", "condemns", "condemning",
-            "denounced", "denounces", "denouncing",
-            "criticized", "criticised", "criticizes", "criticises", "criticizing", "criticising",
-            "slammed", "slams", "slamming", "blasted", "blasts", "blasting",
-            "lambasted", "lambasting", "castigated", "castigating",
-            "rebuked", "rebukes", "rebuking", "reprimanded", "reprimanding",
-            "chastised", "chastising", "scolded", "scolding", "admonished", "admonishing",
-            "faulted", "faults", "faulting", "singled", "singling",
-            "attacked", "attacking", "assailed", "assailing", "vilified", "vilifying",
-        ],
-        "verb_support": [
-            "praised", "praises", "praising", "commended", "commends", "commending",
-            "applauded", "applauds", "applauding", "hailed", "hails", "hailing",
-            "celebrated", "celebrates", "celebrating", "honored", "honoured", "honors", "honours", "honoring", "honouring",
-            "recognized", "recognised", "recognizes", "recognises", "recognizing", "recognising",
-            "endorsed", "endorses", "endorsing", "supported", "supports", "supporting",
-            "backed", "backs", "backing", "championed", "champions", "championing",
-            "advocated", "advocates", "advocating", "promoted", "promotes", "promoting",
-            "defended", "defends", "defending", "justified", "justifies", "justifying",
-            "validated", "validates", "validating", "upheld", "upholds", "upholding",
-            "embraced", "embraces", "embracing", "touted", "touts", "touting",
-        ],
-        "verb_agreement": [
-            "agreed", "agrees", "agreeing", "disagreed", "disagrees", "disagreeing",
-            "concurred", "concurs", "concurring", "disputed", "disputes", "disputing",
-            "contested", "contests", "contesting", "challenged", "challenges", "challenging",
-            "opposed", "opposes", "opposing", "objected", "objects", "objecting",
-            "protested", "protests", "protesting", "resisted", "resists", "resisting",
-            "rejected", "rejects", "rejecting", "refused", "refuses", "refusing",
-            "declined", "declines", "declining", "denied", "denies", "denying",
-            "contradicted", "contradicts", "contradicting", "countered", "counters", "countering",
-            "rebutted", "rebuts", "rebutting", "refuted", "refutes", "refuting",
-            "dismissed", "dismisses", "dismissing", "doubted", "doubts", "doubting",
-        ],
-        "verb_decision": [
-            "decided", "decides", "deciding", "determined", "determines", "determining",
-            "concluded", "concludes", "concluding", "resolved", "resolves", "resolving",
-            "ruled", "rules", "ruling", "judged", "judges", "judging", "decreed", "decreeing",
-            "ordered", "orders", "ordering", "commanded", "commands", "commanding",
-            "directed", "directs", "directing", "instructed", "instructs", "instructing",
-            "mandated", "mandates", "mandating", "required", "requires", "requiring",
-            "demanded", "demands", "demanding", "requested", "requests", "requesting",
-            "urged", "urges", "urging", "encouraged", "encourages", "encouraging",
-            "pressured", "pressures", "pressuring", "pushed", "pushes", "pushing",
-            "lobbied", "lobbies", "lobbying", "petitioned", "petitions", "petitioning",
-            "appealed", "appeals", "appealing", "sought", "seeks", "seeking",
-            "pursued", "pursues", "pursuing", "aimed", "aims", "aiming",
-            "intended", "intends", "intending", "planned", "plans", "planning",
-            "proposed", "proposes", "proposing", "recommended", "recommends", "recommending",
-            "forced", "forces", "forcing", "compelled", "compels", "compelling",
-            "labeled", "labelled", "labels", "labeling", "labelling",
-            "designated", "designates", "designating", "classified", "classifies", "classifying",
-        ],
-        "verb_political": [
-            "enacted", "enacts", "enacting", "legislated", "legislates", "legislating",
-            "passed", "passes", "passing", "vetoed", "vetoes", "vetoing",
-            "signed", "signs", "signing", "ratified", "ratifies", "ratifying",
-            "amended", "amends", "amending", "repealed", "repeals", "repealing",
-            "overturned", "overturns", "overturning", "enforced", "enforces", "enforcing",
-            "implemented", "implements", "implementing", "administered", "administers", "administering",
-            "governed", "governs", "governing", "regulated", "regulates", "regulating",
-            "deregulated", "deregulates", "deregulating", "sanctioned", "sanctions", "sanctioning",
-            "embargoed", "embargoes", "embargoing",
-            "authorized", "authorised", "authorizes", "authorises", "authorizing", "authorising",
-            "approved", "approves", "approving", "certified", "certifies", "certifying",
-            "licensed", "licenced", "licenses", "licences", "licensing", "licencing",
-            "permitted", "permits", "permitting", "banned", "bans", "banning",
-            "prohibited", "prohibits", "prohibiting", "blocked", "blocks", "blocking",
-            "suspended", "suspends", "suspending", "revoked", "revokes", "revoking",
-            "rescinded", "rescinds", "rescinding", "appointed", "appoints", "appointing",
-            "nominated", "nominates", "nominating", "elected", "elects", "electing",
-            "inaugurated", "inaugurates", "inaugurating", "sworn", "swore", "swearing",
-            "impeached", "impeaches", "impeaching", "ousted", "ousts", "ousting",
-            "toppled", "topples", "toppling", "overthrew", "overthrows", "overthrowing",
-            "resigned", "resigns", "resigning", "retired", "retires", "retiring", "quit", "quits", "quitting",
-        ],
-        "verb_military": [
-            "attacked", "attacks", "attacking", "struck", "strikes", "striking",
-            "bombed", "bombs", "bombing", "shelled", "shells", "shelling",
-            "fired", "fires", "firing", "shot", "shoots", "shooting",
-            "targeted", "targets", "targeting", "assaulted", "assaults", "assaulting",
-            "invaded", "invades", "invading", "occupied", "occupies", "occupying",
-            "seized", "seizes", "seizing", "captured", "captures", "capturing",
-            "conquered", "conquers", "conquering", "liberated", "liberates", "liberating",
-            "retreated", "retreats", "retreating", "withdrew", "withdraws", "withdrawing",
-            "deployed", "deploys", "deploying", "mobilized", "mobilised", "mobilizes", "mobilises", "mobilizing", "mobilising",
-            "escalated", "escalates", "escalating", "retaliated", "retaliates", "retaliating",
-            "fortified", "fortifies", "fortifying", "besieged", "besieges", "besieging",
-            "blockaded", "blockades", "blockading", "ambushed", "ambushes", "ambushing",
-            "raided", "raids", "raiding", "stormed", "storms", "storming",
-            "clashed", "clashes", "clashing", "fought", "fights", "fighting",
-            "battled", "battles", "battling", "killed", "kills", "killing",
-            "slew", "slays", "slaying", "murdered", "murders", "murdering",
-            "assassinated", "assassinates", "assassinating", "executed", "executes", "executing",
-            "massacred", "massacres", "massacring", "slaughtered", "slaughters", "slaughtering",
-            "wounded", "wounds", "wounding", "injured", "injures", "injuring",
-            "maimed", "maims", "maiming", "hurt", "hurts", "hurting",
-            "died", "dies", "dying", "perished", "perishes", "perishing",
-            "surrendered", "surrenders", "surrendering", "capitulated", "capitulates", "capitulating",
-            "ceased", "ceases", "ceasing",
-        ],
-        "verb_legal": [
-            "arrested", "arrests", "arresting", "detained", "detains", "detaining",
-            "jailed", "jails", "jailing", "imprisoned", "imprisons", "imprisoning",
-            "incarcerated", "incarcerates", "incarcerating", "released", "releases", "releasing",
-            "freed", "frees", "freeing", "charged", "charges", "charging",
-            "indicted", "indicts", "indicting", "prosecuted", "prosecutes", "prosecuting",
-            "tried", "tries", "trying", "convicted", "convicts", "convicting",
-            "acquitted", "acquits", "acquitting", "sentenced", "sentences", "sentencing",
-            "fined", "fines", "fining", "pardoned", "pardons", "pardoning",
-            "exonerated", "exonerates", "exonerating", "testified", "testifies", "testifying",
-            "sued", "sues", "suing", "settled", "settles", "settling",
-            "litigated", "litigates", "litigating", "extradited", "extradites", "extraditing",
-            "deported", "deports", "deporting", "subpoenaed", "subpoenas", "subpoenaing",
-        ],
-        "verb_economic": [
-            "invested", "invests", "investing", "divested", "divests", "divesting",
-            "acquired", "acquires", "acquiring", "merged", "merges", "merging",
-            "bought", "buys", "buying", "sold", "sells", "selling",
-            "traded", "trades", "trading", "profited", "profits", "profiting",
-            "earned", "earns", "earning", "spent", "spends", "spending",
-            "paid", "pays", "paying", "funded", "funds", "funding",
-            "financed", "finances", "financing", "borrowed", "borrows", "borrowing",
-            "lent", "lends", "lending", "defaulted", "defaults", "defaulting",
-            "restructured", "restructures", "restructuring", "downsized", "downsizes", "downsizing",
-            "expanded", "expands", "expanding", "grew", "grows", "growing",
-            "shrank", "shrinks", "shrinking", "surged", "surges", "surging",
-            "plunged", "plunges", "plunging", "soared", "soars", "soaring",
-            "plummeted", "plummets", "plummeting", "rallied", "rallies", "rallying",
-            "rose", "rises", "rising", "fell", "falls", "falling",
-            "increased", "increases", "increasing", "decreased", "decreases", "decreasing",
-            "doubled", "doubles", "doubling", "tripled", "triples", "tripling",
-            "halved", "halves", "halving", "slashed", "slashes", "slashing",
-            "cut", "cuts", "cutting", "raised", "raises", "raising",
-            "boosted", "boosts", "boosting", "lifted", "lifts", "lifting",
-            "lowered", "lowers", "lowering", "hired", "hires", "hiring",
-            "billed", "bills", "billing", "cost", "costs", "costing",
-        ],
-        "verb_discovery": [
-            "discovered", "discovers", "discovering", "found", "finds", "finding",
-            "uncovered", "uncovers", "uncovering", "unearthed", "unearths", "unearthing",
-            "detected", "detects", "detecting", "identified", "identifies", "identifying",
-            "located", "locates", "locating", "traced", "traces", "tracing",
-            "tracked", "tracks", "tracking", "monitored", "monitors", "monitoring",
-            "surveyed", "surveys", "surveying", "examined", "examines", "examining",
-            "analyzed", "analysed", "analyzes", "analyses", "analyzing", "analysing",
-            "investigated", "investigates", "investigating", "probed", "probes", "probing",
-            "scrutinized", "scrutinised", "scrutinizes", "scrutinises", "scrutinizing", "scrutinising",
-            "reviewed", "reviews", "reviewing", "audited", "audits", "auditing",
-            "inspected", "inspects", "inspecting", "verified", "verifies", "verifying",
-            "tested", "tests", "testing", "searched", "searches", "searching",
-            "recovered", "recovers", "recovering", "encountered", "encounters", "encountering",
-            "proved", "proves", "proving", "proven", "conducted", "conducts", "conducting",
-        ],
-        "verb_change": [
-            "changed", "changes", "changing", "altered", "alters", "altering",
-            "modified", "modifies", "modifying", "revised", "revises", "revising",
-            "updated", "updates", "updating", "upgraded", "upgrades", "upgrading",
-            "improved", "improves", "improving", "enhanced", "enhances", "enhancing",
-            "transformed", "transforms", "transforming", "converted", "converts", "converting",
-            "shifted", "shifts", "shifting", "transitioned", "transitions", "transitioning",
-            "evolved", "evolves", "evolving", "adapted", "adapts", "adapting",
-            "adjusted", "adjusts", "adjusting", "reformed", "reforms", "reforming",
-            "restructured", "restructures", "restructuring",
-            "reorganized", "reorganised", "reorganizes", "reorganises", "reorganizing", "reorganising",
-            "overhauled", "overhauls", "overhauling", "replaced", "replaces", "replacing",
-            "substituted", "substitutes", "substituting", "swapped", "swaps", "swapping",
-            "switched", "switches", "switching", "reversed", "reverses", "reversing",
-        ],
-        "verb_creation": [
-            "created", "creates", "creating", "built", "builds", "building",
-            "constructed", "constructs", "constructing", "developed", "develops", "developing",
-            "designed", "designs", "designing", "invented", "invents", "inventing",
-            "launched", "launches", "launching", "introduced", "introduces", "introducing",
-            "unveiled", "unveils", "unveiling", "opened", "opens", "opening",
-            "established", "establishes", "establishing", "founded", "founds", "founding",
-            "started", "starts", "starting", "began", "begins", "beginning",
-            "initiated", "initiates", "initiating", "closed", "closes", "closing",
-            "shut", "shuts", "shutting", "ended", "ends", "ending",
-            "terminated", "terminates", "terminating", "demolished", "demolishes", "demolishing",
-            "destroyed", "destroys", "destroying", "ruined", "ruins", "ruining",
-            "damaged", "damages", "damaging", "wrecked", "wrecks", "wrecking",
-            "devastated", "devastates", "devastating", "razed", "razes", "razing",
-            "leveled", "levelled", "levels", "leveling", "levelling",
-            "collapsed", "collapses", "collapsing", "imploded", "implodes", "imploding",
-            "exploded", "explodes", "exploding", "detonated", "detonates", "detonating",
-            "burned", "burnt", "burns", "burning", "flooded", "floods", "flooding",
-            "sank", "sinks", "sinking",
-        ],
-        "verb_movement": [
-            "moved", "moves", "moving", "traveled", "travelled", "travels", "traveling", "travelling",
-            "went", "goes", "going", "came", "comes", "coming",
-            "arrived", "arrives", "arriving", "departed", "departs", "departing",
-            "left", "leaves", "leaving", "returned", "returns", "returning",
-            "visited", "visits", "visiting", "toured", "tours", "touring",
-            "fled", "flees", "fleeing", "escaped", "escapes", "escaping",
-            "evacuated", "evacuates", "evacuating", "migrated", "migrates", "migrating",
-            "immigrated", "immigrates", "immigrating", "emigrated", "emigrates", "emigrating",
-            "expelled", "expels", "expelling", "exiled", "exiles", "exiling",
-            "banished", "banishes", "banishing", "crossed", "crosses", "crossing",
-            "entered", "enters", "entering", "exited", "exits", "exiting",
-            "landed", "lands", "landing", "crashed", "crashes", "crashing",
-            "collided", "collides", "colliding", "derailed", "derails", "derailing",
-            "capsized", "capsizes", "capsizing", "embarked", "embarks", "embarking",
-        ],
-        "verb_emotion": [
-            "feared", "fears", "fearing", "worried", "worries", "worrying",
-            "concerned", "concerns", "concerning", "alarmed", "alarms", "alarming",
-            "shocked", "shocks", "shocking", "surprised", "surprises", "surprising",
-            "stunned", "stuns", "stunning", "outraged", "outrages", "outraging",
-            "angered", "angers", "angering", "infuriated", "infuriates", "infuriating",
-            "pleased", "pleases", "pleasing", "delighted", "delights", "delighting",
-            "thrilled", "thrills", "thrilling", "excited", "excites", "exciting",
-            "relieved", "relieves", "relieving", "disappointed", "disappoints", "disappointing",
-            "frustrated", "frustrates", "frustrating", "dismayed", "dismays", "dismaying",
-            "mourned", "mourns", "mourning", "grieved", "grieves", "grieving",
-            "lamented", "laments", "lamenting", "cheered", "cheers", "cheering",
-            "welcomed", "welcomes", "welcoming",
-        ],
-        "verb_prevention": [
-            "prevented", "prevents", "preventing", "stopped", "stops", "stopping",
-            "halted", "halts", "halting", "barred", "bars", "barring",
-            "thwarted", "thwarts", "thwarting", "foiled", "foils", "foiling",
-            "averted", "averts", "averting", "avoided", "avoids", "avoiding",
-            "protected", "protects", "protecting", "shielded", "shields", "shielding",
-            "guarded", "guards", "guarding", "secured", "secures", "securing",
-            "safeguarded", "safeguards", "safeguarding", "preserved", "preserves", "preserving",
-            "saved", "saves", "saving", "rescued", "rescues", "rescuing",
-        ],
-        "verb_competition": [
-            "won", "wins", "winning", "lost", "loses", "losing",
-            "defeated", "defeats", "defeating", "beat", "beats", "beating",
-            "prevailed", "prevails", "prevailing", "triumphed", "triumphs", "triumphing",
-            "succeeded", "succeeds", "succeeding", "failed", "fails", "failing",
-            "achieved", "achieves", "achieving", "accomplished", "accomplishes", "accomplishing",
-            "completed", "completes", "completing", "finished", "finishes", "finishing",
-            "led", "leads", "leading", "trailed", "trails", "trailing",
-            "tied", "ties", "tying", "drew", "draws", "drawing",
-            "qualified", "qualifies", "qualifying", "eliminated", "eliminates", "eliminating",
-            "advanced", "advances", "advancing", "competed", "competes", "competing",
-        ],
-        "verb_medical": [
-            "diagnosed", "diagnoses", "diagnosing", "treated", "treats", "treating",
-            "cured", "cures", "curing", "healed", "heals", "healing",
-            "hospitalized", "hospitalised", "hospitalizes", "hospitalises", "hospitalizing", "hospitalising",
-            "operated", "operates", "operating", "vaccinated", "vaccinates", "vaccinating",
-            "infected", "infects", "infecting", "contracted", "contracts", "contracting",
-            "spread", "spreads", "spreading", "transmitted", "transmits", "transmitting",
-            "quarantined", "quarantines", "quarantining", "isolated", "isolates", "isolating",
-            "sickened", "sickens", "sickening", "suffered", "suffers", "suffering",
-        ],
-    }
-    for category, verbs in verb_categories.items():
-        pattern = r'\b(?:' + '|'.join(verbs) + r')\b'
-        for match in re.finditer(pattern, text, re.IGNORECASE):
+    for match in _WORD_PATTERN.finditer(text):
+        category = _VERB_LOOKUP.get(match.group().lower())
+        if category:
             add_highlight(match.start(), match.end(), category)
 
     # === ENTITIES (clickable) ===
 
     # 4. Titles followed by names - match FIRST as one unit (e.g., "president Xi Jinping")
-    for title in app.titles:
-        pattern = r'\b(' + re.escape(title) + r'\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)'
-        for match in re.finditer(pattern, text, re.IGNORECASE):
-            full_phrase = match.group(1)
-            add_highlight(match.start(), match.end(), "people", full_phrase)
+    # A rejected match may hide a title starting inside it ("president said
+    # minister Smith"), so retry one character later instead of skipping past it
+    pos = 0
+    match = _TITLE_PATTERN.search(text, pos)
+    while match:
+        if add_highlight(match.start(), match.end(), "people", match.group(1)):
+            pos = match.end()
+        else:
+            pos = match.start() + 1
+        match = _TITLE_PATTERN.search(text, pos)
 
     # 5. Find ALL capitalized word sequences, then classify them
     # This matches: "Zhang Youxia", "President Xi Jinping", "Central Military Commission"
     # Also handles possessives: "China's" -> "China"
-    cap_sequence_pattern = r"([A-Z][a-z]+(?:[-'][a-z]+)?(?:\s+(?:of|the|and|for|de|von|van)?\s*[A-Z][a-z]+(?:[-'][a-z]+)?)*)"
 
     # Collect all sequences first
     sequences = []
-    for match in re.finditer(cap_sequence_pattern, text):
+    for match in _CAP_SEQUENCE_PATTERN.finditer(text):
         phrase = match.group(1)
         start = match.start()
         end = match.end()
@@ -540,136 +738,114 @@ def apply_highlighting(app, text_widget, text):
 
         sequences.append((start, end, display_end, phrase))
 
-    # Words to skip (sentence starters, common words)
-    skip_words = {
-        "the", "a", "an", "this", "that", "these", "those", "it", "its",
-        "has", "have", "had", "been", "was", "were", "are", "is", "be",
-        "said", "says", "told", "added", "noted", "asked", "called",
-        "new", "many", "more", "most", "some", "all", "other", "such",
-        "also", "just", "even", "still", "well", "back", "now", "then",
-        "but", "and", "for", "not", "you", "his", "her", "their", "our",
-        "first", "last", "next", "high", "low", "long", "short", "big",
-        "according", "including", "during", "after", "before", "since",
-        "while", "where", "when", "which", "what", "who", "how", "why",
-        "continue", "reading", "here", "there", "very", "much", "far",
-        "however", "although", "though", "because", "therefore", "thus",
-    }
+    # Sentence starts: position 0 or right after ". ", "! ", "? "
+    sentence_starts = {0}
+    sentence_starts.update(m.end() for m in _SENTENCE_END_PATTERN.finditer(text))
 
-    # Classify and highlight each sequence
+    # Classify and highlight each sequence; repeated phrases are classified once
+    classified = {}
     for start, end, display_end, phrase in sequences:
-        phrase_lower = phrase.lower()
-        words = phrase.split()
+        at_sentence_start = start in sentence_starts
+        key = (phrase, at_sentence_start)
+        if key not in classified:
+            classified[key] = _classify_phrase(phrase, at_sentence_start)
+        result = classified[key]
 
-        # Skip single common words
-        if len(words) == 1 and words[0].lower() in skip_words:
-            continue
+        # Apply highlight if category was determined
+        if result:
+            category, search_term = result
+            add_highlight(start, display_end, category, search_term)
 
-        # Check if this is at sentence start (position 0 or after ". ")
-        at_sentence_start = False
-        if start == 0:
-            at_sentence_start = True
-        elif start > 1 and text[start-2:start] in (". ", "! ", "? "):
-            at_sentence_start = True
-
-        # At sentence start, only skip if it's a single common word
-        # Multi-word sequences (names) at sentence start should still be highlighted
-        if at_sentence_start and len(words) == 1:
-            # Single word at sentence start - only highlight if known entity
-            if phrase_lower not in app.countries and phrase_lower not in app.places and phrase_lower not in app.organizations:
-                continue
-
-        # Determine category by checking against known entities and patterns
-        category = None
-        search_term = phrase
-
-        # Check known entity databases (exact match)
-        if phrase_lower in app.leaders:
+    return tuple(spans)
+
+
+def _classify_phrase(phrase, at_sentence_start):
+    """Return (category, search_term) for a capitalized phrase, or None."""
+    # Lowercase once; the original-case words are only split out for the
+    # branches that need them
+    phrase_lower = phrase.lower()
+    words_lower = phrase_lower.split()
+    n_words = len(words_lower)
+
+    # Skip single common words
+    if n_words == 1 and phrase_lower in _SKIP_WORDS:
+        return None
+
+    # At sentence start, only skip if it's a single common word
+    # Multi-word sequences (names) at sentence start should still be highlighted
+    if at_sentence_start and n_words == 1:
+        # Single word at sentence start - only highlight if known entity
+        if phrase_lower not in _SENTENCE_START_ENTITIES:
+            return None
+
+    # Strongest institution keyword in the phrase, if any
+    keyword_match = None
+    for w in words_lower:
+        match = _PHRASE_KEYWORDS.get(w)
+        if match and (keyword_match is None or match < keyword_match):
+            keyword_match = match
+
+    # Determine category by checking against known entities and patterns
+    category = None
+    search_term = phrase
+
+    # Check known entity databases (exact match)
+    if phrase_lower in _ENTITY_LOOKUP:
+        category = _ENTITY_LOOKUP[phrase_lower]
+
+    # Check for title + name pattern (e.g., "President Xi Jinping")
+    elif words_lower[0] in TITLES:
+        category = "titles"
+        # If more than just title, it's title + name
+        if n_words > 1:
+            # Highlight whole thing as title+person combined
+            category = "people"
+            search_term = " ".join(phrase.split()[1:])  # Search just the name
+
+    # Check for government/military/organization keywords
+    # (X Y Commission, X Army, X University)
+    elif keyword_match:
+        category = keyword_match[1]
+
+    # Default: if 2-3 capitalized words, likely a person's name
+    elif 2 <= n_words <= 3:
+        # Check if all words look like name parts (not org keywords)
+        looks_like_name = all(
+            w[0].isupper() and w_lower not in _SKIP_WORDS
+            for w, w_lower in zip(phrase.split(), words_lower)
+        )
+        if looks_like_name:
             category = "people"
-        elif phrase_lower in app.events:
-            category = "events"
-        elif phrase_lower in app.military:
-            category = "military"
-        elif phrase_lower in app.government:
-            category = "government"
-        elif phrase_lower in app.organizations:
-            category = "organizations"
-        elif phrase_lower in app.countries:
-            category = "countries"
-        elif phrase_lower in app.places:
-            category = "places"
-
-        # Check for title + name pattern (e.g., "President Xi Jinping")
-        elif words[0].lower() in app.titles:
-            category = "titles"
-            # If more than just title, it's title + name
-            if len(words) > 1:
-                # Highlight whole thing as title+person combined
-                category = "people"
-                search_term = " ".join(words[1:])  # Search just the name
-
-        # Check for organizational patterns (X Y Commission/Ministry/etc.)
-        elif any(w.lower() in {"commission", "committee", "council", "ministry",
-                               "department", "bureau", "agency", "authority",
-                               "administration", "board", "corps", "command"}
-                for w in words):
-            category = "government"
-
-        # Check for military patterns
-        elif any(w.lower() in {"army", "navy", "force", "forces", "guard", "corps",
-                               "fleet", "brigade", "division", "regiment"}
-                for w in words):
-            category = "military"
-
-        # Check for organization patterns
-        elif any(w.lower() in {"university", "college", "institute", "corporation",
-                               "company", "inc", "corp", "foundation", "association",
-                               "bank", "group", "trust"}
-                for w in words):
-            category = "organizations"
-
-        # Default: if 2-3 capitalized words, likely a person's name
-        elif len(words) >= 2 and len(words) <= 3:
-            # Check if all words look like name parts (not org keywords)
-            looks_like_name = all(
-                w[0].isupper() and w.lower() not in skip_words
-                for w in words
-            )
-            if looks_like_name:
-                category = "people"
-
-        # Single capitalized word in middle of sentence - check databases
-        elif len(words) == 1:
-            word = words[0]
-            word_lower = word.lower()
-            if word_lower in app.countries:
-                category = "countries"
-            elif word_lower in app.places:
-                category = "places"
-            elif word_lower in app.organizations:
-                category = "organizations"
-            elif not at_sentence_start:
-                # Mid-sentence capitalization = proper noun
-                category = "proper_nouns"
-
-        # Fallback: mid-sentence capitalized phrase not matching any category
-        if not category and not at_sentence_start and len(words) >= 1:
-            category = "proper_nouns"
 
-        # Apply highlight if category was determined
-        if category:
-            add_highlight(start, display_end, category, search_term)
+    # Fallback: mid-sentence capitalized phrase not matching any category
+    # (single words known to a database were matched exactly above)
+    if not category and not at_sentence_start:
+        category = "proper_nouns"
+
+    if category:
+        return category, search_term
+    return None
 
 
 def on_wiki_link_click(app, event):
     """Handle click on wiki link - open Wikipedia search."""
-    index = app.preview_text.index(f"@{event.x},{event.y}")
-    line, char = index.split(".")
-    char_offset = int(char)
-
-    for (start, end), (search_term, category) in app.wiki_link_targets.items():
-        if start <= char_offset < end:
-            import urllib.parse
-            query = urllib.parse.quote(search_term)
-            url = f"https://en.wikipedia.org/wiki/Special:Search?search={query}&go=Go"
-            webbrowser.open(url)
+    text = app.preview_text
+    index = text.index(f"@{event.x},{event.y}")
+
+    # Tk already knows which tag range was clicked; only its start offset
+    # is needed to find the search term
+    for tag in text.tag_names(index):
+        if tag not in app.highlight_categories:
+            continue
+        tag_range = text.tag_prevrange(tag, f"{index}+1c")
+        if not tag_range:
+            return
+        count = text.count("1.0", tag_range[0], "chars")
+        target = app.wiki_link_targets.get(count[0] if count else 0)
+        if not target:
             return
+        end, search_term, category = target
+        query = urllib.parse.quote(search_term)
+        url = f"https://en.wikipedia.org/wiki/Special:Search?search={query}&go=Go"
+        webbrowser.open(url)
+        return
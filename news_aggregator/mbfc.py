@@ -4,6 +4,7 @@ Loads the local mbfc_sources.json built by fetch_mbfc.py and provides
 domain normalization and source lookup for article URLs.
 """
 
+import functools
 import json
 import os
 import re
@@ -62,6 +63,10 @@ def load_mbfc_data(path=None):
     _sources = _mbfc_data.get("sources", {})
     _aliases = _mbfc_data.get("aliases", {})
 
+    # Memoized results depend on the alias and source tables just replaced
+    _domain_for_host.cache_clear()
+    lookup_domain.cache_clear()
+
     count = len(_sources)
     print(f"[MBFC] Loaded {count} sources, {len(_aliases)} aliases")
     return count
@@ -85,27 +90,66 @@ def normalize_domain(url):
         if domain:
             return _resolve_alias(domain)
 
-    # Standard URL parsing
+    hostname = _host(url)
+    if not hostname:
+        return ""
+    return _domain_for_host(hostname)
+
+
+@functools.lru_cache(maxsize=4096)
+def _host(url):
+    """Lowercased hostname of a URL, or "" if it has none."""
     try:
         parsed = urlparse(url if "://" in url else f"https://{url}")
-        hostname = (parsed.hostname or "").lower().strip(".")
+        return (parsed.hostname or "").lower().strip(".")
     except Exception:
         return ""
 
-    if not hostname:
-        return ""
 
-    # Strip common subdomains
-    domain = _strip_subdomains(hostname)
-    return _resolve_alias(domain)
+@functools.lru_cache(maxsize=4096)
+def _domain_for_host(hostname):
+    """Publisher domain for a hostname: common subdomains stripped, aliases resolved."""
+    return _resolve_alias(_strip_subdomains(hostname))
 
 
 def lookup_source(url):
     """Look up MBFC data for a URL. Returns source dict or None."""
     if not _sources:
         return None
+    return lookup_domain(normalize_domain(url))
+
+
+def lookup_article_source(article):
+    """Look up MBFC data for a stored article dict, reusing its publisher_domain."""
+    if not _sources:
+        return None
+    domain = article.get("publisher_domain")
+    if domain:
+        return lookup_domain(domain)
+    return lookup_domain(normalize_domain(article.get("link", "")))
+
 
-    domain = normalize_domain(url)
+def lookup_sources_batch(links):
+    """Look up many URLs at once. Returns a list of (domain, source) pairs.
+
+    Each link is normalized once, and sources are resolved once per distinct
+    domain, since links from one feed mostly share a publisher.
+    """
+    by_domain = {}
+    results = []
+    for link in links:
+        domain = normalize_domain(link)
+        if domain in by_domain:
+            source = by_domain[domain]
+        else:
+            source = by_domain[domain] = lookup_domain(domain) if _sources else None
+        results.append((domain, source))
+    return results
+
+
+@functools.lru_cache(maxsize=4096)
+def lookup_domain(domain):
+    """Look up MBFC data for an already-normalized domain. Returns source dict or None."""
     if not domain:
         return None
 
@@ -237,10 +281,14 @@ def composite_score(article_score, source=None):
 
     Returns article_score unchanged when no MBFC publisher score is available.
     """
-    pub = publisher_score(source)
-    if pub is None:
+    return blend_scores(article_score, publisher_score(source))
+
+
+def blend_scores(article_score, pub_score):
+    """composite_score for an already-computed publisher score (None = no MBFC data)."""
+    if pub_score is None:
         return article_score
-    return round(0.4 * pub + 0.6 * article_score)
+    return round(0.4 * pub_score + 0.6 * article_score)
 
 
 def _resolve_alias(domain):
@@ -3,10 +3,23 @@
 import sqlite3
 import math
 import os
+import threading
 from datetime import datetime, timedelta
 from typing import Optional
 from config import DATABASE_NAME, DATA_FOLDER, DEFAULT_FEEDS, DEFAULT_SETTINGS
 
+# Column order for add_articles_bulk rows
+ARTICLE_INSERT_COLUMNS = (
+    "feed_id", "title", "link", "summary", "published", "author", "noise_score",
+    "publisher_domain", "article_score", "publisher_score",
+    "mbfc_bias", "mbfc_reporting", "mbfc_credibility", "mbfc_flags",
+)
+
+_INSERT_ARTICLE_SQL = (
+    f"INSERT OR IGNORE INTO articles ({', '.join(ARTICLE_INSERT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(ARTICLE_INSERT_COLUMNS))})"
+)
+
 
 class Storage:
     def __init__(self, db_path: Optional[str] = None):
@@ -18,10 +31,49 @@ class Storage:
             db_path = os.path.join(data_dir, DATABASE_NAME)
 
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+        # One persistent connection per thread so the UI and fetch threads never
+        # share a cursor or transaction; an in-memory database only exists on
+        # its own connection, so that case keeps a single shared one
+        self._local = threading.local()
+        # get_feeds results keyed by enabled_only; cleared by every feeds write
+        self._feeds_cache = {}
+        self._feeds_generation = 0
+        # Bumped on every article write, so callers can tell when cached
+        # get_articles results are stale
+        self.articles_version = 0
+        # Bumped only when stored scores, dates or domains can change (not on
+        # read/favorite/hide), for caches of score aggregates
+        self.scores_version = 0
+        self._shared_conn = self._connect() if db_path == ":memory:" else None
         self._init_db()
 
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The calling thread's connection, opened on first use."""
+        if self._shared_conn is not None:
+            return self._shared_conn
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure a new connection."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        # WAL lets UI reads proceed while a refresh is writing; not valid in-memory
+        if self.db_path != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-262144")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # Foreign keys stay unenforced, as the schema has always run: remove_feed
+        # deletes a feed's articles itself, and a fetch finishing after its feed
+        # was removed must not fail the whole bulk insert
+        return conn
+
     def _init_db(self):
         """Initialize database tables."""
         cursor = self.conn.cursor()
@@ -202,6 +254,7 @@ class Storage:
                 (name, url, category, bias, factual, author_url_pattern)
             )
             self.conn.commit()
+            self._invalidate_feeds()
             return cursor.lastrowid
         except sqlite3.IntegrityError:
             return None
@@ -212,14 +265,48 @@ class Storage:
         cursor.execute("DELETE FROM articles WHERE feed_id = ?", (feed_id,))
         cursor.execute("DELETE FROM feeds WHERE id = ?", (feed_id,))
         self.conn.commit()
+        self._invalidate_feeds()
 
     def get_feeds(self, enabled_only: bool = True) -> list:
         """Get all feeds."""
+        cached = self._feeds_cache.get(enabled_only)
+        if cached is None:
+            generation = self._feeds_generation
+            cursor = self.conn.cursor()
+            if enabled_only:
+                cursor.execute("SELECT * FROM feeds WHERE enabled = 1 ORDER BY category, name")
+            else:
+                cursor.execute("SELECT * FROM feeds ORDER BY category, name")
+            cached = [dict(row) for row in cursor.fetchall()]
+            # Don't keep a result that raced with a write on another thread
+            if generation == self._feeds_generation:
+                self._feeds_cache[enabled_only] = cached
+        # Callers may mutate the dicts, so hand out copies
+        return [dict(feed) for feed in cached]
+
+    def _invalidate_feeds(self):
+        """Drop cached get_feeds results after a write to the feeds table."""
+        self._feeds_generation += 1
+        self._feeds_cache = {}
+        # Article rows carry joined feed fields (name, category, bias), and
+        # removing a feed can take its articles with it
+        self.articles_version += 1
+        self.scores_version += 1
+
+    def get_feed_listing(self) -> list:
+        """Get id, name, category and url of all feeds, skipping the favicon blobs."""
         cursor = self.conn.cursor()
-        if enabled_only:
-            cursor.execute("SELECT * FROM feeds WHERE enabled = 1 ORDER BY category, name")
-        else:
-            cursor.execute("SELECT * FROM feeds ORDER BY category, name")
+        cursor.execute("SELECT id, name, category, url FROM feeds ORDER BY category, name")
+        return [dict(row) for row in cursor.fetchall()]
+
+    def get_feeds_with_favicon_flags(self) -> list:
+        """Get enabled feeds with a has_favicon flag in place of the favicon blob."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT id, name, category, url,
+                   (favicon IS NOT NULL AND length(favicon) > 0) AS has_favicon
+            FROM feeds WHERE enabled = 1 ORDER BY category, name
+        """)
         return [dict(row) for row in cursor.fetchall()]
 
     def get_feed(self, feed_id: int) -> Optional[dict]:
@@ -237,6 +324,7 @@ class Storage:
             (1 if enabled else 0, feed_id)
         )
         self.conn.commit()
+        self._invalidate_feeds()
 
     def update_feed_fetched(self, feed_id: int):
         """Update the last_fetched timestamp for a feed."""
@@ -246,6 +334,7 @@ class Storage:
             (datetime.now().isoformat(), feed_id)
         )
         self.conn.commit()
+        self._invalidate_feeds()
 
     def set_feed_favicon(self, feed_id: int, favicon_data: bytes):
         """Store favicon data for a feed."""
@@ -255,6 +344,7 @@ class Storage:
             (favicon_data, feed_id)
         )
         self.conn.commit()
+        self._invalidate_feeds()
 
     def get_feed_favicon(self, feed_id: int) -> Optional[bytes]:
         """Get favicon data for a feed."""
@@ -263,6 +353,12 @@ class Storage:
         row = cursor.fetchone()
         return row[0] if row and row[0] else None
 
+    def get_all_favicons(self) -> dict:
+        """Get stored favicon data for every feed that has one, keyed by feed id."""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT id, favicon FROM feeds WHERE favicon IS NOT NULL AND length(favicon) > 0")
+        return {row[0]: row[1] for row in cursor.fetchall()}
+
     # Article operations
     def add_article(self, feed_id: int, title: str, link: str, summary: str = "",
                     published: str = None, author: str = "", noise_score: int = 0,
@@ -282,6 +378,8 @@ class Storage:
                   publisher_domain, article_score, publisher_score,
                   mbfc_bias, mbfc_reporting, mbfc_credibility, mbfc_flags))
             self.conn.commit()
+            self.articles_version += 1
+            self.scores_version += 1
             return cursor.lastrowid
         except sqlite3.IntegrityError:
             # Article already exists, update scores and credibility data
@@ -293,12 +391,47 @@ class Storage:
             """, (noise_score, publisher_domain, article_score, publisher_score,
                   mbfc_bias, mbfc_reporting, mbfc_credibility, mbfc_flags, link))
             self.conn.commit()
+            self.articles_version += 1
+            self.scores_version += 1
             return None
 
+    def add_articles_bulk(self, rows: list) -> int:
+        """Add many articles in one transaction. Returns count of new articles.
+
+        Each row is a tuple in ARTICLE_INSERT_COLUMNS order. Existing links get
+        their scores and credibility data updated, as in add_article.
+        """
+        if not rows:
+            return 0
+        # A feed can repeat a link; the last copy's scores win, as with add_article
+        rows = list({row[2]: row for row in rows}.values())
+        if self.conn.in_transaction:
+            self.conn.commit()
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            # Refresh existing links first; the UPDATE matches nothing for new
+            # ones, so the INSERT's rowcount is exactly the new articles
+            cursor.executemany("""
+                UPDATE articles SET noise_score = ?, publisher_domain = ?,
+                    article_score = ?, publisher_score = ?,
+                    mbfc_bias = ?, mbfc_reporting = ?, mbfc_credibility = ?, mbfc_flags = ?
+                WHERE link = ?
+            """, [row[6:] + (row[2],) for row in rows])
+            cursor.executemany(_INSERT_ARTICLE_SQL, rows)
+            new_count = cursor.rowcount
+            self.conn.commit()
+            self.articles_version += 1
+            self.scores_version += 1
+        except Exception:
+            self.conn.rollback()
+            raise
+        return new_count
+
     def get_articles(self, feed_id: Optional[int] = None, feed_ids: list = None,
                      include_read: bool = True, favorites_only: bool = False,
                      min_score: int = 0, recency_hours: int = 0, max_per_source: int = 0,
-                     limit: int = 500) -> list:
+                     limit: int = 500, search: Optional[str] = None) -> list:
         """Get articles with optional filters.
 
         Args:
@@ -310,6 +443,7 @@ class Storage:
             recency_hours: Only show articles from last N hours (0 = no limit)
             max_per_source: Max articles per feed, ranked by quality (0 = no limit)
             limit: Maximum number of articles to return
+            search: Only articles whose title or summary contains this text
         """
         cursor = self.conn.cursor()
 
@@ -340,6 +474,12 @@ class Storage:
             query += " AND a.published >= ?"
             params.append(cutoff)
 
+        if search:
+            # LIKE is case-insensitive for ASCII; escape its wildcards in the term
+            pattern = "%" + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            query += " AND (a.title LIKE ? ESCAPE '\\' OR a.summary LIKE ? ESCAPE '\\')"
+            params.extend((pattern, pattern))
+
         query += " ORDER BY a.published DESC LIMIT ?"
         params.append(limit)
 
@@ -397,6 +537,7 @@ class Storage:
             (1 if is_read else 0, article_id)
         )
         self.conn.commit()
+        self.articles_version += 1
 
     def mark_article_favorite(self, article_id: int, is_favorite: bool = True):
         """Mark an article as favorite or unfavorite."""
@@ -406,6 +547,7 @@ class Storage:
             (1 if is_favorite else 0, article_id)
         )
         self.conn.commit()
+        self.articles_version += 1
 
     def mark_all_read(self, feed_id: Optional[int] = None):
         """Mark all articles as read, optionally for a specific feed."""
@@ -415,6 +557,7 @@ class Storage:
         else:
             cursor.execute("UPDATE articles SET is_read = 1")
         self.conn.commit()
+        self.articles_version += 1
 
     def hide_article(self, article_id: int, is_hidden: bool = True):
         """Hide or unhide an article."""
@@ -424,6 +567,7 @@ class Storage:
             (1 if is_hidden else 0, article_id)
         )
         self.conn.commit()
+        self.articles_version += 1
 
     def search_articles(self, query: str, min_score: int = 0, limit: int = 100) -> list:
         """Search articles by title or summary."""
@@ -445,6 +589,8 @@ class Storage:
         cutoff = (datetime.now() - timedelta(days=days)).isoformat()
         cursor.execute("DELETE FROM articles WHERE created_at < ? AND is_favorite = 0", (cutoff,))
         self.conn.commit()
+        self.articles_version += 1
+        self.scores_version += 1
         return cursor.rowcount
 
     def delete_all_articles(self):
@@ -452,6 +598,8 @@ class Storage:
         cursor = self.conn.cursor()
         cursor.execute("DELETE FROM articles WHERE is_favorite = 0")
         self.conn.commit()
+        self.articles_version += 1
+        self.scores_version += 1
         return cursor.rowcount
 
     def get_article_count(self, feed_id: Optional[int] = None, unread_only: bool = False) -> int:
@@ -470,6 +618,15 @@ class Storage:
         cursor.execute(query, params)
         return cursor.fetchone()[0]
 
+    def get_all_unread_counts(self) -> dict:
+        """Get unread article counts for every feed in one query, keyed by feed id."""
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT feed_id, COUNT(*) FROM articles "
+            "WHERE is_hidden = 0 AND is_read = 0 GROUP BY feed_id"
+        )
+        return {row[0]: row[1] for row in cursor.fetchall()}
+
     # Filter keyword operations
     def add_filter_keyword(self, keyword: str, weight: int = 10) -> Optional[int]:
         """Add a custom filter keyword."""
@@ -530,6 +687,7 @@ class Storage:
             (category, feed_id)
         )
         self.conn.commit()
+        self._invalidate_feeds()
 
     # Trend / rolling-average queries
 
@@ -588,6 +746,32 @@ class Storage:
             "recent_articles": recent_articles,
         }
 
+    def get_all_publisher_trends(self, days: int = 90) -> dict:
+        """Return {domain: {avg_score, std_dev, count}} for every publisher domain.
+
+        Same aggregate stats and 10-article floor as get_publisher_trend_data,
+        computed for all domains in one grouped query.
+        """
+        cursor = self.conn.cursor()
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        cursor.execute(
+            "SELECT publisher_domain, AVG(noise_score), COUNT(*), AVG(noise_score * noise_score) "
+            "FROM articles WHERE publisher_domain IS NOT NULL AND publisher_domain != '' "
+            "AND published >= ? "
+            "GROUP BY publisher_domain HAVING COUNT(*) >= 10",
+            (cutoff,),
+        )
+        trends = {}
+        for domain, avg, count, avg_sq in cursor.fetchall():
+            if avg is None:
+                continue
+            trends[domain] = {
+                "avg_score": round(avg, 1),
+                "std_dev": round(math.sqrt(max(avg_sq - avg * avg, 0)), 1),
+                "count": count,
+            }
+        return trends
+
     def get_author_trend_data(self, author: str) -> Optional[dict]:
         """Return {avg_score, count} for an author (loose LIKE match).
 
@@ -614,5 +798,7 @@ class Storage:
         return score < publisher_data["avg_score"] - 1.5 * publisher_data["std_dev"]
 
     def close(self):
-        """Close the database connection."""
+        """Close the calling thread's database connection."""
+        # Worker threads' connections are released with their thread-local state
         self.conn.close()
+        self._local.conn = None
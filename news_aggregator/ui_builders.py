@@ -24,6 +24,9 @@ def setup_styles(app):
 
     # Frames
     style.configure("TFrame", background=t["bg"])
+    # Padded dialog frames, resolved once here instead of per widget
+    style.configure("Dialog.TFrame", padding=10)
+    style.configure("DialogWide.TFrame", padding=20)
     style.configure("TLabel", background=t["bg"], foreground=t["fg"])
     style.configure("TButton", background=t["bg_tertiary"], foreground=t["cyan"], padding=5,
                      bordercolor=t["cyan_dim"], lightcolor=t["bg_tertiary"],
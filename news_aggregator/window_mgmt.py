@@ -5,6 +5,39 @@ import os
 
 from config import DARK_THEME
 
+# Win32 user32 bindings with explicit prototypes, resolved once at import
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    _user32 = ctypes.WinDLL("user32")
+
+    _GetWindowLongW = _user32.GetWindowLongW
+    _GetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int]
+    _GetWindowLongW.restype = ctypes.c_long
+
+    _SetWindowLongW = _user32.SetWindowLongW
+    _SetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int, ctypes.c_long]
+    _SetWindowLongW.restype = ctypes.c_long
+
+    _SetWindowPos = _user32.SetWindowPos
+    _SetWindowPos.argtypes = [wintypes.HWND, wintypes.HWND, ctypes.c_int, ctypes.c_int,
+                              ctypes.c_int, ctypes.c_int, wintypes.UINT]
+    _SetWindowPos.restype = wintypes.BOOL
+
+    _MoveWindow = _user32.MoveWindow
+    _MoveWindow.argtypes = [wintypes.HWND, ctypes.c_int, ctypes.c_int,
+                            ctypes.c_int, ctypes.c_int, wintypes.BOOL]
+    _MoveWindow.restype = wintypes.BOOL
+
+    _ShowWindow = _user32.ShowWindow
+    _ShowWindow.argtypes = [wintypes.HWND, ctypes.c_int]
+    _ShowWindow.restype = wintypes.BOOL
+
+    _SystemParametersInfoW = _user32.SystemParametersInfoW
+    _SystemParametersInfoW.argtypes = [wintypes.UINT, wintypes.UINT, wintypes.LPVOID, wintypes.UINT]
+    _SystemParametersInfoW.restype = wintypes.BOOL
+
 
 def strip_title_bar(app):
     """Remove native title bar using Win32 API while keeping proper window management."""
@@ -12,7 +45,6 @@ def strip_title_bar(app):
         app.root.overrideredirect(True)
         return
     try:
-        import ctypes
         app.root.update_idletasks()
         hwnd = int(app.root.wm_frame(), 16)
         app._hwnd = hwnd
@@ -28,51 +60,74 @@ def strip_title_bar(app):
         SWP_NOSIZE = 0x0001
         SWP_NOZORDER = 0x0004
 
-        style = ctypes.windll.user32.GetWindowLongW(hwnd, GWL_STYLE)
+        style = _GetWindowLongW(hwnd, GWL_STYLE)
         style = style & ~WS_CAPTION & ~WS_THICKFRAME & ~WS_SYSMENU
         style = style | WS_MINIMIZEBOX | WS_VISIBLE
-        ctypes.windll.user32.SetWindowLongW(hwnd, GWL_STYLE, style)
+        _SetWindowLongW(hwnd, GWL_STYLE, style)
 
-        ctypes.windll.user32.SetWindowPos(
-            hwnd, 0, 0, 0, 0, 0,
+        _SetWindowPos(
+            hwnd, None, 0, 0, 0, 0,
             SWP_FRAMECHANGED | SWP_NOMOVE | SWP_NOSIZE | SWP_NOZORDER
         )
     except Exception:
         app.root.overrideredirect(True)
 
 
+# Bump when the icon design in _generate_owner_icon changes
+OWNER_ICON_VERSION = 2
+
+# Loaded icon fonts keyed by pixel size
+_owner_icon_fonts = {}
+
+
 def setup_owner_icon(app):
     """Set the taskbar icon on the hidden owner window."""
     try:
-        from PIL import Image, ImageDraw, ImageFont
-        ico_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "icon.ico")
-        # Generate crisp icon: bold cyan W with magenta shadow on dark bg
-        ico_sizes = [256, 64, 48, 32, 24, 16]
-        frames = []
-        for s in ico_sizes:
-            img = Image.new("RGBA", (s, s), (5, 5, 10, 255))
-            draw = ImageDraw.Draw(img)
-            bw = max(1, s // 64)
-            draw.rectangle([0, 0, s - 1, s - 1], outline=(0, 255, 255, 255), width=bw)
-            font_size = int(s * 0.7)
-            try:
-                font = ImageFont.truetype("consola.ttf", font_size)
-            except Exception:
-                font = ImageFont.load_default()
-            bbox = draw.textbbox((0, 0), "W", font=font)
-            tw, th = bbox[2] - bbox[0], bbox[3] - bbox[1]
-            x = (s - tw) // 2
-            y = (s - th) // 2 - bbox[1]
-            off = max(1, s // 64)
-            draw.text((x + off, y + off), "W", fill=(255, 0, 255, 180), font=font)
-            draw.text((x, y), "W", fill=(0, 255, 255, 255), font=font)
-            frames.append(img)
-        frames[0].save(ico_path, format="ICO", append_images=frames[1:])
+        ico_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data",
+                                f"icon-v{OWNER_ICON_VERSION}.ico")
+        # Icon is deterministic --- only rasterize it when this version isn't saved yet
+        if not os.path.exists(ico_path):
+            _generate_owner_icon(ico_path)
         app._owner.iconbitmap(ico_path)
     except Exception:
         pass
 
 
+def _generate_owner_icon(ico_path):
+    """Draw the multi-size taskbar icon and save it to ico_path."""
+    from PIL import Image, ImageDraw, ImageFont
+    # Generate crisp icon: bold cyan W with magenta shadow on dark bg
+    ico_sizes = [256, 64, 48, 32, 24, 16]
+    frames = []
+    have_truetype = True
+    for s in ico_sizes:
+        img = Image.new("RGBA", (s, s), (5, 5, 10, 255))
+        draw = ImageDraw.Draw(img)
+        bw = max(1, s // 64)
+        draw.rectangle([0, 0, s - 1, s - 1], outline=(0, 255, 255, 255), width=bw)
+        font_size = int(s * 0.7)
+        font = _owner_icon_fonts.get(font_size)
+        if font is None:
+            # If Consolas is missing for one size it's missing for all of them
+            if have_truetype:
+                try:
+                    font = ImageFont.truetype("consola.ttf", font_size)
+                    _owner_icon_fonts[font_size] = font
+                except Exception:
+                    have_truetype = False
+            if font is None:
+                font = ImageFont.load_default()
+        bbox = draw.textbbox((0, 0), "W", font=font)
+        tw, th = bbox[2] - bbox[0], bbox[3] - bbox[1]
+        x = (s - tw) // 2
+        y = (s - th) // 2 - bbox[1]
+        off = max(1, s // 64)
+        draw.text((x + off, y + off), "W", fill=(255, 0, 255, 180), font=font)
+        draw.text((x, y), "W", fill=(0, 255, 255, 255), font=font)
+        frames.append(img)
+    frames[0].save(ico_path, format="ICO", append_images=frames[1:])
+
+
 def on_taskbar_restore(app, event=None):
     """Restore window when taskbar icon is clicked."""
     app._owner.attributes("-alpha", 0)  # Keep owner invisible
@@ -86,13 +141,14 @@ def start_drag(app, event):
     """Record drag start position."""
     app._drag_start_x = event.x_root
     app._drag_start_y = event.y_root
+    # geometry() is "WxH+X+Y"; X/Y may be negative on multi-monitor setups
     geo = app.root.geometry()
-    import re
-    m = re.match(r'(\d+)x(\d+)\+(-?\d+)\+(-?\d+)', geo)
-    if m:
-        app._drag_win_x = int(m.group(3))
-        app._drag_win_y = int(m.group(4))
-    else:
+    try:
+        _, _, pos = geo.partition("+")
+        x_s, _, y_s = pos.partition("+")
+        app._drag_win_x = int(x_s)
+        app._drag_win_y = int(y_s)
+    except ValueError:
         app._drag_win_x = app.root.winfo_x()
         app._drag_win_y = app.root.winfo_y()
     app.root.lift()
@@ -104,15 +160,25 @@ def do_drag(app, event):
         toggle_maximize(app)
     dx = event.x_root - app._drag_start_x
     dy = event.y_root - app._drag_start_y
-    x = app._drag_win_x + dx
-    y = app._drag_win_y + dy
+    # Motion events arrive far faster than the window can repaint, so keep only
+    # the latest position and move once per idle pass
+    if app._pending_move is None:
+        app.root.after_idle(lambda: flush_move(app))
+    app._pending_move = (app._drag_win_x + dx, app._drag_win_y + dy)
+
+
+def flush_move(app):
+    """Apply the most recent pending drag position."""
+    if app._pending_move is None:
+        return
+    x, y = app._pending_move
+    app._pending_move = None
     # Use Win32 MoveWindow with repaint flag to avoid ghosting
     if sys.platform == "win32" and hasattr(app, "_hwnd"):
         try:
-            import ctypes
             w = app.root.winfo_width()
             h = app.root.winfo_height()
-            ctypes.windll.user32.MoveWindow(app._hwnd, x, y, w, h, True)
+            _MoveWindow(app._hwnd, x, y, w, h, True)
             return
         except Exception:
             pass
@@ -129,8 +195,7 @@ def minimize_window(app):
     """Minimize to taskbar."""
     if sys.platform == "win32" and hasattr(app, "_hwnd"):
         try:
-            import ctypes
-            ctypes.windll.user32.ShowWindow(app._hwnd, 6)  # SW_MINIMIZE
+            _ShowWindow(app._hwnd, 6)  # SW_MINIMIZE
             return
         except Exception:
             pass
@@ -148,11 +213,9 @@ def toggle_maximize(app):
         app._normal_geometry = app.root.geometry()
         # Get usable work area (excludes taskbar) via Win32 API
         try:
-            import ctypes
-            from ctypes import wintypes
             rect = wintypes.RECT()
             # SPI_GETWORKAREA = 0x0030
-            ctypes.windll.user32.SystemParametersInfoW(0x0030, 0, ctypes.byref(rect), 0)
+            _SystemParametersInfoW(0x0030, 0, ctypes.byref(rect), 0)
             x, y, w, h = rect.left, rect.top, rect.right - rect.left, rect.bottom - rect.top
         except Exception:
             x, y = 0, 0
@@ -186,8 +249,28 @@ def start_resize(app, event):
 def do_resize(app, event):
     dx = event.x_root - app._resize_x
     dy = event.y_root - app._resize_y
-    new_w = max(900, app._resize_w + dx)
-    new_h = max(500, app._resize_h + dy)
+    if app._pending_resize is None:
+        app.root.after_idle(lambda: flush_resize(app))
+    app._pending_resize = (max(900, app._resize_w + dx), max(500, app._resize_h + dy))
+
+
+def flush_resize(app):
+    """Apply the most recent pending resize."""
+    if app._pending_resize is None:
+        return
+    new_w, new_h = app._pending_resize
+    app._pending_resize = None
+    # Resize the native window directly; Tk picks up the new size from WM_SIZE
+    if sys.platform == "win32" and hasattr(app, "_hwnd"):
+        try:
+            SWP_NOMOVE = 0x0002
+            SWP_NOZORDER = 0x0004
+            SWP_NOACTIVATE = 0x0010
+            if _SetWindowPos(app._hwnd, None, 0, 0, new_w, new_h,
+                             SWP_NOMOVE | SWP_NOZORDER | SWP_NOACTIVATE):
+                return
+        except Exception:
+            pass
     app.root.geometry(f"{new_w}x{new_h}")
 
 
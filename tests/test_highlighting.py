@@ -0,0 +1,53 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "news_aggregator"))
+
+from highlighting import append_highlighting, compute_highlights
+
+
+def _highlights(text):
+    return [(text[start:end], tag, search_term) for start, end, tag, search_term in compute_highlights(text)]
+
+
+def test_title_inside_rejected_title_match_is_found():
+    # "president said minister" matches first but overlaps the "said" verb span;
+    # the title starting inside it must still be tried
+    text = "The president said minister Smith Jones would resign."
+    assert ("minister Smith Jones", "people", "minister Smith Jones") in _highlights(text)
+    assert not any(phrase == "Smith Jones" for phrase, _, _ in _highlights(text))
+
+
+def test_longest_title_wins():
+    text = "Talks with prime minister Keir Starmer continue."
+    assert ("prime minister Keir Starmer", "people", "prime minister Keir Starmer") in _highlights(text)
+
+
+class _Widget:
+    def insert(self, *args):
+        pass
+
+    def tag_add(self, *args):
+        pass
+
+    def tag_remove(self, *args):
+        pass
+
+
+class _App:
+    _typewriter_spans = ()
+    highlight_categories = {"people"}
+
+
+def test_appended_spans_match_full_text():
+    sentence = ("The president said minister Smith Jones would resign on Jan. 5, 2024 "
+                "after prime minister Keir Starmer announced $4.5 billion in U.S. aid. ")
+    words = (sentence * 12).split(" ")
+    app, widget, text = _App(), _Widget(), ""
+    for i in range(0, len(words), 3):
+        chunk = " ".join(words[i:i + 3])
+        if text:
+            chunk = " " + chunk
+        append_highlighting(app, widget, text, chunk)
+        text += chunk
+    assert set(app._typewriter_spans) == set(compute_highlights(text))